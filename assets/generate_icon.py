@@ -84,7 +84,16 @@ def draw_not_meta_logo(size: int) -> "Image.Image":
 
 def build_ico(output: pathlib.Path) -> None:
     sizes = [16, 24, 32, 48, 64, 128, 256]
-    frames = [draw_not_meta_logo(s) for s in sizes]
+
+    # Draw once at high resolution and let Pillow's Lanczos resize produce
+    # the larger frames – one render pass instead of seven, with better
+    # anti-aliasing than per-size scanline drawing. The tiniest sizes are
+    # still drawn natively so edges stay crisp at 16/24 px.
+    master = draw_not_meta_logo(512)
+    frames = [
+        draw_not_meta_logo(s) if s < 32 else master.resize((s, s), Image.Resampling.LANCZOS)
+        for s in sizes
+    ]
 
     # Save as ICO using Pillow's built-in ICO support
     frames[0].save(
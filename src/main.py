@@ -11,13 +11,65 @@ import pathlib
 # Add src/ to path so absolute imports work from the exe and dev mode
 sys.path.insert(0, str(pathlib.Path(__file__).parent))
 
-from ui.main_window import MainWindow
 
+def _show_splash() -> "object":
+    """Create a tiny borderless splash window using plain tk only.
 
-def main() -> None:
+    Importing tkinter alone is cheap; the expensive customtkinter/PIL/ui
+    stack is deferred until the splash is already on screen.
+    """
+    import tkinter as tk
+
+    splash = tk.Tk()
+    splash.overrideredirect(True)
+    splash.configure(bg="#0a0a0f")
+
+    w, h = 320, 120
+    x = (splash.winfo_screenwidth() - w) // 2
+    y = (splash.winfo_screenheight() - h) // 2
+    splash.geometry(f"{w}x{h}+{x}+{y}")
+
+    tk.Label(
+        splash,
+        text="Not-Meta Prompt Library",
+        font=("Segoe UI", 14, "bold"),
+        bg="#0a0a0f",
+        fg="#00ff88",
+    ).pack(expand=True)
+    tk.Label(
+        splash,
+        text="Loading…",
+        font=("Segoe UI", 10),
+        bg="#0a0a0f",
+        fg="#7a7a9a",
+    ).pack(pady=(0, 16))
+
+    splash.update_idletasks()
+    return splash
+
+
+def _start_app(splash) -> None:
+    # Heavy import happens here, hidden behind the splash
+    from ui.main_window import MainWindow
+
+    splash.destroy()
     app = MainWindow()
     app.mainloop()
 
 
+def main() -> None:
+    import threading
+
+    # Warm the heaviest import on a background thread while the splash
+    # paints; _start_app's own import then hits sys.modules.
+    threading.Thread(
+        target=lambda: __import__("customtkinter"), daemon=True
+    ).start()
+
+    splash = _show_splash()
+    splash.after(10, _start_app, splash)
+    splash.mainloop()
+
+
 if __name__ == "__main__":
     main()
@@ -16,7 +16,7 @@ from .prompt import Prompt
 SCHEMA_VERSION = 1
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class LibraryState:
     """Full serialisable state of the prompt library."""
 
@@ -44,6 +44,14 @@ class LibraryState:
     @staticmethod
     def from_dict(data: dict[str, object]) -> "LibraryState":
         prompts_raw = data.get("prompts", [])
+        if data.get("schema_version") == SCHEMA_VERSION:
+            # Our own writer produced this – decode without per-field
+            # coercions, falling back to the defensive path on surprise.
+            try:
+                prompts = [Prompt.from_trusted_dict(p) for p in prompts_raw]
+                return LibraryState(schema_version=SCHEMA_VERSION, prompts=prompts)
+            except Exception:  # noqa: BLE001 – hand-edited/foreign files land here
+                pass
         prompts = [Prompt.from_dict(p) for p in prompts_raw if isinstance(p, dict)]
         return LibraryState(
             schema_version=int(data.get("schema_version", SCHEMA_VERSION)),
@@ -7,6 +7,7 @@ No persistence, no UI, no business logic beyond validation.
 
 from __future__ import annotations
 
+import dataclasses
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -20,11 +21,34 @@ class PromptRole(str, Enum):
     SUFFIX = "suffix"
 
 
-@dataclass
+# Plain-dict lookups are far cheaper than EnumMeta.__call__ (and its
+# ValueError path) when decoding thousands of prompts on load.
+_ROLE_MAP: dict[str, PromptRole] = {r.value: r for r in PromptRole}
+_ROLE_TO_STR: dict[PromptRole, str] = {r: r.value for r in PromptRole}
+
+
+def coerce_prompt_id(value: object) -> int:
+    """Normalise a prompt id (canonical int or legacy hex string) to int.
+
+    Ids live in memory as 128-bit ints – cheaper to hash and ~50 bytes
+    smaller per prompt than the 36-char hex string, which remains the
+    on-disk JSON representation.
+    """
+    if isinstance(value, int):
+        return value
+    return uuid.UUID(str(value)).int
+
+
+def prompt_id_to_str(value: int) -> str:
+    """Render a prompt id in its canonical hex-string JSON form."""
+    return str(uuid.UUID(int=value))
+
+
+@dataclass(slots=True, eq=False)
 class Prompt:
     """Immutable-ish prompt entry with identity, metadata and content."""
 
-    id: str
+    id: int
     name: str
     content: str
     role: PromptRole
@@ -34,6 +58,16 @@ class Prompt:
     created_at: float
     updated_at: float
 
+    # Identity is the id – lets sets/dicts of prompts dedupe in O(1)
+    # instead of comparing every field.
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Prompt):
+            return self.id == other.id
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
     # ------------------------------------------------------------------
     # Factory
     # ------------------------------------------------------------------
@@ -42,7 +76,7 @@ class Prompt:
     def create(name: str, content: str, role: PromptRole, category: str) -> "Prompt":
         now = time.time()
         return Prompt(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().int,
             name=name.strip(),
             content=content,
             role=role,
@@ -59,10 +93,10 @@ class Prompt:
 
     def to_dict(self) -> dict:
         return {
-            "id": self.id,
+            "id": prompt_id_to_str(self.id),
             "name": self.name,
             "content": self.content,
-            "role": self.role.value,
+            "role": _ROLE_TO_STR[self.role],
             "category": self.category,
             "usage_count": self.usage_count,
             "is_favorite": self.is_favorite,
@@ -72,14 +106,16 @@ class Prompt:
 
     @staticmethod
     def from_dict(data: dict[str, object]) -> "Prompt":
-        role_raw = data.get("role", "body")
+        role = _ROLE_MAP.get(data.get("role", "body"), PromptRole.BODY)
+
+        raw_id = data.get("id")
         try:
-            role = PromptRole(role_raw)
+            prompt_id = coerce_prompt_id(raw_id) if raw_id is not None else uuid.uuid4().int
         except ValueError:
-            role = PromptRole.BODY
+            prompt_id = uuid.uuid4().int
 
         return Prompt(
-            id=str(data.get("id", str(uuid.uuid4()))),
+            id=prompt_id,
             name=str(data.get("name", "Unnamed")),
             content=str(data.get("content", "")),
             role=role,
@@ -90,16 +126,48 @@ class Prompt:
             updated_at=float(data.get("updated_at", time.time())),
         )
 
+    @staticmethod
+    def from_trusted_dict(data: dict[str, object]) -> "Prompt":
+        """Decode a dict written by our own to_dict, skipping coercions.
+
+        JSON decoding already yields native str/int/float/bool, so the
+        defensive str()/int()/float()/bool() casts in from_dict are pure
+        overhead on the load hot path. Callers fall back to from_dict
+        for foreign or partial data.
+        """
+        return Prompt(
+            id=coerce_prompt_id(data["id"]),
+            name=data["name"],
+            content=data["content"],
+            role=_ROLE_MAP[data["role"]],
+            category=data["category"],
+            usage_count=data["usage_count"],
+            is_favorite=data["is_favorite"],
+            created_at=data["created_at"],
+            updated_at=data["updated_at"],
+        )
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    def bump_usage(self) -> None:
+        """Increment usage_count in place.
+
+        The one hot-path exception to the copy-on-write convention:
+        fired on every copy click, and no derived state (search, role
+        lists) depends on the counter.
+        """
+        self.usage_count += 1
+        self.updated_at = time.time()
+
     def with_updated_fields(self, **kwargs: object) -> "Prompt":
         """Return a new Prompt with given fields overwritten."""
-        data = self.to_dict()
-        data.update(kwargs)
-        data["updated_at"] = time.time()
-        return Prompt.from_dict(data)
+        role = kwargs.get("role")
+        if isinstance(role, str):
+            kwargs["role"] = _ROLE_MAP.get(role, PromptRole.BODY)
+        kwargs["updated_at"] = time.time()
+        return dataclasses.replace(self, **kwargs)
 
     @property
     def rank_score(self) -> float:
@@ -21,7 +21,10 @@ class ClipboardService:
         try:
             self._root.clipboard_clear()
             self._root.clipboard_append(text)
-            self._root.update()
+            # update_idletasks() is enough for the clipboard to be visible
+            # to other apps; a full update() would pump the whole event
+            # queue and redraw the UI on every copy.
+            self._root.update_idletasks()
             return True
         except Exception:  # noqa: BLE001
             return False
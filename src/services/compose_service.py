@@ -7,11 +7,16 @@ entries, a body string, and ordered suffix entries. No UI, no I/O.
 
 from __future__ import annotations
 
+import io
 from enum import Enum
-from typing import List, Sequence
+from typing import Iterator, List, Sequence
 
 from models.prompt import Prompt
 
+# Below this many selected parts, a plain str.join wins; StringIO has a
+# fixed setup cost that only pays off on big multi-part composes.
+_JOIN_FAST_PATH_PARTS = 16
+
 
 class ComposeSeparator(str, Enum):
     """How individual parts are joined during composition."""
@@ -57,20 +62,21 @@ class ComposeService:
         they are joined with the same separator as the main parts.
         """
         sep = separator.to_str(custom_separator)
-        parts: List[str] = []
-
-        for p in prefixes:
-            if p.content.strip():
-                parts.append(p.content)
-
-        if body.strip():
-            parts.append(body)
-
-        for s in suffixes:
-            if s.content.strip():
-                parts.append(s.content)
-
-        return sep.join(parts)
+        if len(prefixes) + len(suffixes) <= _JOIN_FAST_PATH_PARTS:
+            return sep.join(self._parts(prefixes, body, suffixes))
+
+        # Large compose: stream parts into one growable buffer instead of
+        # letting join materialize an intermediate sequence first.
+        buf = io.StringIO()
+        write = buf.write
+        first = True
+        for part in self._parts(prefixes, body, suffixes):
+            if first:
+                first = False
+            else:
+                write(sep)
+            write(part)
+        return buf.getvalue()
 
     def preview(
         self,
@@ -82,7 +88,34 @@ class ComposeService:
         max_chars: int = 300,
     ) -> str:
         """Return truncated preview for display in UI."""
-        full = self.compose(prefixes, body, suffixes, separator, custom_separator)
-        if len(full) <= max_chars:
-            return full
-        return full[:max_chars] + "…"
+        sep = separator.to_str(custom_separator)
+        # Stop accumulating once the preview window is full – no point
+        # joining a multi-KB compose just to show 300 chars.
+        pieces: List[str] = []
+        joined_len = -len(sep)  # the first part carries no separator
+        for part in self._parts(prefixes, body, suffixes):
+            pieces.append(part)
+            joined_len += len(part) + len(sep)
+            if joined_len > max_chars:
+                return sep.join(pieces)[:max_chars] + "…"
+        return sep.join(pieces)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _parts(prefixes: Sequence[Prompt], body: str, suffixes: Sequence[Prompt]) -> Iterator[str]:
+        """Yield non-blank parts in compose order.
+
+        `isspace()` short-circuits on the first non-whitespace char, so
+        blank checks allocate no stripped copies of the content.
+        """
+        for p in prefixes:
+            if p.content and not p.content.isspace():
+                yield p.content
+        if body and not body.isspace():
+            yield body
+        for s in suffixes:
+            if s.content and not s.content.isspace():
+                yield s.content
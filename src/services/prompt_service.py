@@ -9,9 +9,9 @@ Single source of truth for the in-memory state.
 from __future__ import annotations
 
 import time
-from typing import Callable, List, Optional
+from typing import Callable, Iterable, List, Optional
 
-from models.prompt import Prompt, PromptRole
+from models.prompt import Prompt, PromptRole, coerce_prompt_id, prompt_id_to_str
 from models.library_state import LibraryState
 from services.storage_service import StorageService
 
@@ -19,14 +19,36 @@ from services.storage_service import StorageService
 # Observers notify UI of state changes without coupling to tkinter/CTk.
 StateChangedCallback = Callable[[LibraryState], None]
 
+# Deferred-call hook matching tk's `after(ms, callback)` signature, injected
+# so the service can debounce disk writes without depending on tkinter.
+SaveScheduler = Callable[[int, Callable[[], None]], object]
+
+# How long to coalesce mutation bursts before flushing to disk.
+_FLUSH_DELAY_MS = 500
+
+# Compact the journal into a fresh snapshot once it grows past this.
+_COMPACT_BYTES = 1_000_000
+
 
 class PromptService:
     """Manages all prompt CRUD and persistence coordination."""
 
-    def __init__(self, storage: StorageService) -> None:
+    def __init__(self, storage: StorageService, scheduler: Optional[SaveScheduler] = None) -> None:
         self._storage = storage
         self._state: LibraryState = storage.load()
         self._observers: List[StateChangedCallback] = []
+        # id → list index, kept in sync so mutations avoid O(n) scans
+        self._index: dict[int, int] = self._build_index()
+        # id → lowercased "name\ncontent\ncategory" haystack so search does
+        # one C-level substring test per prompt instead of three lower() calls
+        self._haystacks: dict[int, str] = {
+            p.id: self._haystack(p) for p in self._state.prompts
+        }
+        # Debounced-write state; without a scheduler every mutation saves
+        # synchronously, as before.
+        self._scheduler = scheduler
+        self._dirty = False
+        self._flush_scheduled = False
 
     # ------------------------------------------------------------------
     # Observer pattern (decouples service from UI layer)
@@ -57,19 +79,39 @@ class PromptService:
     def get_by_role(self, role: PromptRole) -> List[Prompt]:
         return [p for p in self._state.prompts if p.role == role]
 
-    def search(self, query: str) -> List[Prompt]:
-        if not query:
-            return self.get_all()
+    def search(
+        self,
+        query: str,
+        within: Optional[List[Prompt]] = None,
+        category: Optional[str] = None,
+    ) -> List[Prompt]:
+        """Search all prompts, or narrow a previous result set via `within`.
+
+        The category equality test runs before the substring scan – an
+        interned string compare is far cheaper, so category-filtered
+        typing skips the haystack scan for mismatched prompts entirely.
+        """
+        src = within if within is not None else self._state.prompts
+        if not query and category is None:
+            return list(src)
         q = query.lower()
+        haystacks = self._haystacks
         return [
-            p for p in self._state.prompts
-            if q in p.name.lower() or q in p.content.lower() or q in p.category.lower()
+            p for p in src
+            if (category is None or p.category == category)
+            and (not q or q in haystacks[p.id])
         ]
 
     def ranked(self, prompts: Optional[List[Prompt]] = None) -> List[Prompt]:
-        """Return prompts sorted by rank_score descending."""
+        """Return prompts sorted by rank_score descending.
+
+        The (is_favorite, usage_count) tuple orders identically to
+        rank_score – the favourite bonus always dominates – but lets
+        TimSort compare plain attributes instead of re-running the
+        property per comparison.
+        """
         src = prompts if prompts is not None else self.get_all()
-        return sorted(src, key=lambda p: p.rank_score, reverse=True)
+        return sorted(src, key=lambda p: (p.is_favorite, p.usage_count), reverse=True)
 
     # ------------------------------------------------------------------
     # Mutations
@@ -77,54 +119,132 @@ class PromptService:
 
     def create(self, name: str, content: str, role: PromptRole, category: str) -> Prompt:
         prompt = Prompt.create(name, content, role, category)
+        self._index[prompt.id] = len(self._state.prompts)
         self._state.prompts.append(prompt)
-        self._persist()
+        self._haystacks[prompt.id] = self._haystack(prompt)
+        self._record({"op": "add", "prompt": prompt.to_dict()})
         return prompt
 
-    def update(self, prompt_id: str, **kwargs: object) -> Optional[Prompt]:
-        for i, p in enumerate(self._state.prompts):
-            if p.id == prompt_id:
-                updated = p.with_updated_fields(**kwargs)
-                self._state.prompts[i] = updated
-                self._persist()
-                return updated
-        return None
-
-    def delete(self, prompt_id: str) -> bool:
-        before = len(self._state.prompts)
-        self._state.prompts = [p for p in self._state.prompts if p.id != prompt_id]
-        changed = len(self._state.prompts) < before
-        if changed:
-            self._persist()
-        return changed
-
-    def toggle_favorite(self, prompt_id: str) -> Optional[Prompt]:
-        for p in self._state.prompts:
-            if p.id == prompt_id:
-                return self.update(prompt_id, is_favorite=not p.is_favorite)
-        return None
-
-    def increment_usage(self, prompt_id: str) -> None:
-        for p in self._state.prompts:
-            if p.id == prompt_id:
-                self.update(prompt_id, usage_count=p.usage_count + 1)
-                return
+    def update(self, prompt_id: int | str, **kwargs: object) -> Optional[Prompt]:
+        prompt_id = coerce_prompt_id(prompt_id)
+        i = self._index.get(prompt_id)
+        if i is None:
+            return None
+        updated = self._state.prompts[i].with_updated_fields(**kwargs)
+        self._state.prompts[i] = updated
+        self._haystacks[prompt_id] = self._haystack(updated)
+        fields = dict(kwargs)
+        fields["updated_at"] = updated.updated_at
+        self._record({"op": "upd", "id": prompt_id_to_str(prompt_id), "fields": fields})
+        return updated
+
+    def delete(self, prompt_id: int | str) -> bool:
+        prompt_id = coerce_prompt_id(prompt_id)
+        i = self._index.pop(prompt_id, None)
+        if i is None:
+            return False
+        del self._state.prompts[i]
+        self._haystacks.pop(prompt_id, None)
+        # Only indices after the removed slot shift left
+        for p in self._state.prompts[i:]:
+            self._index[p.id] -= 1
+        self._record({"op": "del", "id": prompt_id_to_str(prompt_id)})
+        return True
+
+    def toggle_favorite(self, prompt_id: int | str) -> Optional[Prompt]:
+        i = self._index.get(coerce_prompt_id(prompt_id))
+        if i is None:
+            return None
+        p = self._state.prompts[i]
+        p.is_favorite = not p.is_favorite
+        p.updated_at = time.time()
+        self._record({
+            "op": "upd",
+            "id": prompt_id_to_str(p.id),
+            "fields": {"is_favorite": p.is_favorite, "updated_at": p.updated_at},
+        })
+        return p
+
+    def increment_usage(self, prompt_id: int | str) -> None:
+        self.increment_usage_many((prompt_id,))
+
+    def increment_usage_many(self, prompt_ids: "Iterable[int | str]") -> None:
+        """Bump usage for several prompts with a single state broadcast."""
+        ops = []
+        for pid in prompt_ids:
+            i = self._index.get(coerce_prompt_id(pid))
+            if i is None:
+                continue
+            p = self._state.prompts[i]
+            p.bump_usage()
+            ops.append({
+                "op": "upd",
+                "id": prompt_id_to_str(p.id),
+                "fields": {"usage_count": p.usage_count, "updated_at": p.updated_at},
+            })
+        if ops:
+            self._record_many(ops)
 
     def import_state(self, new_state: LibraryState, merge: bool = False) -> None:
         """Replace or merge imported prompts. Deduplicates by ID."""
         if merge:
-            existing_ids = {p.id for p in self._state.prompts}
             for p in new_state.prompts:
-                if p.id not in existing_ids:
+                if p.id not in self._index:
+                    self._index[p.id] = len(self._state.prompts)
                     self._state.prompts.append(p)
+                    self._haystacks[p.id] = self._haystack(p)
         else:
             self._state = new_state
+            self._index = self._build_index()
+            self._haystacks = {p.id: self._haystack(p) for p in new_state.prompts}
         self._persist()
 
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Compact journaled changes into a fresh snapshot immediately."""
+        self._flush_scheduled = False
+        if self._dirty:
+            self._dirty = False
+            self._storage.save(self._state)
+
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
+    def _build_index(self) -> dict[int, int]:
+        return {p.id: i for i, p in enumerate(self._state.prompts)}
+
+    @staticmethod
+    def _haystack(prompt: Prompt) -> str:
+        return f"{prompt.name}\n{prompt.content}\n{prompt.category}".lower()
+
+    def _record(self, op: dict) -> None:
+        """Journal one mutation; durability is O(delta), not O(library)."""
+        self._record_many((op,))
+
+    def _record_many(self, ops: "Iterable[dict]") -> None:
+        """Journal a batch of mutations with one notification."""
+        for op in ops:
+            self._storage.append_op(op)
+        self._dirty = True
+        self._notify()
+        if self._scheduler is None:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._scheduler(_FLUSH_DELAY_MS, self._maybe_compact)
+
+    def _maybe_compact(self) -> None:
+        """Debounced check: rewrite the snapshot only once the journal is big."""
+        self._flush_scheduled = False
+        if self._storage.journal_size >= _COMPACT_BYTES:
+            self.flush()
+
     def _persist(self) -> None:
-        self._storage.save(self._state)
+        """Full snapshot save + notify, for bulk operations like imports."""
+        self._dirty = True
         self._notify()
+        self.flush()
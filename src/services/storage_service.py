@@ -7,14 +7,25 @@ Knows nothing about UI or business logic.
 
 from __future__ import annotations
 
+import io
 import json
 import os
 import pathlib
-import shutil
-import time
+import queue
+import threading
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # orjson is optional – fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
 from models.library_state import LibraryState
+from models.prompt import Prompt, coerce_prompt_id
+
+
+# Writer-thread shutdown sentinel
+_SHUTDOWN = object()
 
 
 def _default_data_dir() -> pathlib.Path:
@@ -30,40 +41,93 @@ class StorageService:
         self._dir = data_dir or _default_data_dir()
         self._dir.mkdir(parents=True, exist_ok=True)
         self._path = self._dir / "prompts.json"
+        # Append-only mutation journal, replayed atop the snapshot on load
+        # and truncated whenever a full snapshot is written.
+        self._journal = self._dir / "prompts.log"
+        self._journal_size = self._journal.stat().st_size if self._journal.exists() else 0
+        # Snapshot writes happen on a background thread so JSON encode and
+        # disk latency never block the UI. Single-slot queue: newest wins.
+        self._journal_lock = threading.Lock()
+        self._write_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def load(self) -> LibraryState:
-        """Load state from disk. Returns empty state on any error."""
+        """Load the last snapshot, then replay any journaled mutations."""
         if not self._path.exists():
-            return LibraryState.empty()
-
-        try:
-            raw = self._path.read_text(encoding="utf-8")
-            data: dict[str, object] = json.loads(raw)
-            return LibraryState.from_dict(data)
-        except Exception:  # noqa: BLE001 – intentional catch-all for corrupted data
-            return LibraryState.empty()
+            state = LibraryState.empty()
+        else:
+            try:
+                raw = self._path.read_bytes()
+                data: dict[str, object] = orjson.loads(raw) if orjson else json.loads(raw)
+                state = LibraryState.from_dict(data)
+            except Exception:  # noqa: BLE001 – intentional catch-all for corrupted data
+                state = LibraryState.empty()
+        self._replay_journal(state)
+        return state
 
     def save(self, state: LibraryState) -> None:
-        """Persist state to disk atomically (write-and-rename)."""
-        tmp = self._path.with_suffix(".tmp")
+        """Queue a snapshot for the background writer (newest state wins).
+
+        The dict snapshot is taken on the caller's thread, so the writer
+        never touches live mutable state; only encode + I/O are deferred.
+        """
+        job = (state.to_dict(), self._journal_size)
+        while True:
+            try:
+                self._write_queue.put_nowait(job)
+                return
+            except queue.Full:
+                try:
+                    self._write_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def close(self) -> None:
+        """Drain pending snapshot writes and stop the writer thread."""
+        self._write_queue.put(_SHUTDOWN)
+        self._writer.join(timeout=2.0)
+
+    def append_op(self, op: dict) -> None:
+        """Append one mutation record to the journal (O(delta) per edit)."""
+        line = (orjson.dumps(op) if orjson else json.dumps(op, ensure_ascii=False).encode("utf-8")) + b"\n"
         try:
-            tmp.write_text(
-                json.dumps(state.to_dict(), indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            shutil.move(str(tmp), str(self._path))
+            with self._journal_lock:
+                with open(self._journal, "ab") as f:
+                    f.write(line)
+                self._journal_size += len(line)
         except Exception as exc:  # noqa: BLE001
-            print(f"[StorageService] Save failed: {exc}")
-            if tmp.exists():
-                tmp.unlink(missing_ok=True)
+            print(f"[StorageService] Journal append failed: {exc}")
+
+    @property
+    def journal_size(self) -> int:
+        """Current journal size in bytes – used to decide when to compact."""
+        return self._journal_size
 
     def export_json(self, state: LibraryState) -> str:
         """Return pretty-printed JSON of the full state."""
-        return json.dumps(state.to_dict(), indent=2, ensure_ascii=False)
+        return self._encode(state.to_dict()).decode("utf-8")
+
+    def export_json_to(self, state: LibraryState, fp) -> None:
+        """Write pretty-printed JSON of the full state to a binary file.
+
+        Avoids materializing the whole export as a Python str first –
+        orjson hands back bytes, and the stdlib path streams json.dump
+        straight into the file.
+        """
+        if orjson is not None:
+            fp.write(orjson.dumps(state.to_dict(), option=orjson.OPT_INDENT_2))
+            return
+        wrapper = io.TextIOWrapper(fp, encoding="utf-8")
+        try:
+            json.dump(state.to_dict(), wrapper, ensure_ascii=False, indent=2)
+            wrapper.flush()
+        finally:
+            wrapper.detach()  # leave closing fp to the caller
 
     def import_json(self, raw_json: str) -> LibraryState:
         """Parse and return a LibraryState from a JSON string."""
@@ -73,3 +137,85 @@ class StorageService:
     @property
     def storage_path(self) -> pathlib.Path:
         return self._path
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _encode(data: dict) -> bytes:
+        """Serialise a state dict to pretty-printed UTF-8 JSON bytes."""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _writer_loop(self) -> None:
+        while True:
+            job = self._write_queue.get()
+            if job is _SHUTDOWN:
+                return
+            snapshot, journal_upto = job
+            self._write_snapshot(snapshot, journal_upto)
+
+    def _write_snapshot(self, snapshot: dict, journal_upto: int) -> None:
+        """Atomically write one snapshot and drop the journaled ops it covers."""
+        tmp = self._path.with_suffix(".tmp")
+        try:
+            tmp.write_bytes(self._encode(snapshot))
+            # Same-directory rename: os.replace is a single syscall and is
+            # guaranteed atomic on both POSIX and Windows.
+            os.replace(tmp, self._path)
+            self._truncate_journal(journal_upto)
+        except Exception as exc:  # noqa: BLE001
+            print(f"[StorageService] Save failed: {exc}")
+            if tmp.exists():
+                tmp.unlink(missing_ok=True)
+
+    def _truncate_journal(self, upto: int) -> None:
+        """Remove the first `upto` journal bytes, keeping ops appended since
+        the snapshot was taken."""
+        with self._journal_lock:
+            try:
+                if not self._journal.exists():
+                    self._journal_size = 0
+                    return
+                with open(self._journal, "r+b") as f:
+                    f.seek(upto)
+                    rest = f.read()
+                    f.seek(0)
+                    f.write(rest)
+                    f.truncate()
+                self._journal_size = len(rest)
+            except Exception as exc:  # noqa: BLE001
+                print(f"[StorageService] Journal truncate failed: {exc}")
+
+    def _replay_journal(self, state: LibraryState) -> None:
+        """Apply journaled ops (add/upd/del) to state in place."""
+        if self._journal_size == 0 or not self._journal.exists():
+            return
+        try:
+            index = {p.id: i for i, p in enumerate(state.prompts)}
+            for line in self._journal.read_bytes().splitlines():
+                if not line.strip():
+                    continue
+                op: dict = orjson.loads(line) if orjson else json.loads(line)
+                kind = op.get("op")
+                if kind == "add":
+                    prompt = Prompt.from_dict(op["prompt"])
+                    if prompt.id not in index:  # idempotent vs. post-compaction replay
+                        index[prompt.id] = len(state.prompts)
+                        state.prompts.append(prompt)
+                elif kind == "upd":
+                    i = index.get(coerce_prompt_id(op.get("id")))
+                    if i is not None:
+                        merged = state.prompts[i].to_dict()
+                        merged.update(op.get("fields", {}))
+                        state.prompts[i] = Prompt.from_dict(merged)
+                elif kind == "del":
+                    i = index.pop(coerce_prompt_id(op.get("id")), None)
+                    if i is not None:
+                        del state.prompts[i]
+                        for p in state.prompts[i:]:
+                            index[p.id] -= 1
+        except Exception:  # noqa: BLE001 – a corrupt journal must not kill the snapshot
+            pass
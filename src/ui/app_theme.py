@@ -7,6 +7,8 @@ every widget imports from here instead of hardcoding hex values.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 
 class AppTheme:
     """Not-Meta cyberpunk dark palette."""
@@ -75,6 +77,12 @@ class AppTheme:
     }
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def role_badge(role: str) -> tuple:
-        """Return (bg, fg) for a role badge."""
+        """Return (bg, fg) for a role badge.
+
+        Pure function of the role string (~3 distinct values), called per
+        card/row build – memoized so repeated lookups cost one C-level
+        cache hit.
+        """
         return AppTheme.ROLE_COLORS.get(role, ("#1a1a1a", "#aaaaaa"))
@@ -37,7 +37,7 @@ class CreatePromptDialog(ctk.CTkToplevel):
         self.grab_set()
 
         self._build(existing)
-        self.after(100, self._center)
+        self._center()
 
     # ------------------------------------------------------------------
     # Build
@@ -164,6 +164,11 @@ class CreatePromptDialog(ctk.CTkToplevel):
 
     def _center(self) -> None:
         self.update_idletasks()
-        x = self.master.winfo_x() + (self.master.winfo_width() - self.winfo_width()) // 2
-        y = self.master.winfo_y() + (self.master.winfo_height() - self.winfo_height()) // 2
+        if self.master.winfo_width() > 1:
+            x = self.master.winfo_x() + (self.master.winfo_width() - self.winfo_width()) // 2
+            y = self.master.winfo_y() + (self.master.winfo_height() - self.winfo_height()) // 2
+        else:
+            # Master not mapped yet – fall back to screen centre
+            x = (self.winfo_screenwidth() - self.winfo_width()) // 2
+            y = (self.winfo_screenheight() - self.winfo_height()) // 2
         self.geometry(f"+{x}+{y}")
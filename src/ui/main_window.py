@@ -9,24 +9,28 @@ sessions. Delegates all behaviour to panels and services.
 
 from __future__ import annotations
 
+import io
 import json
 import os
 import pathlib
+import queue
 import sys
+import threading
 import tkinter as tk
+from functools import lru_cache
 from typing import Optional
 
 import customtkinter as ctk
 
-from services.storage_service import StorageService
-from services.prompt_service import PromptService
-from services.compose_service import ComposeService
-from services.clipboard_service import ClipboardService
+try:
+    import orjson
+except ImportError:  # orjson is optional – fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
 from ui.app_theme import AppTheme
-from ui.panels.library_panel import LibraryPanel
-from ui.panels.compose_panel import ComposePanel
 
 
+@lru_cache(maxsize=1)
 def _assets_dir() -> pathlib.Path:
     """Return the assets directory regardless of frozen/dev mode."""
     if getattr(sys, "frozen", False):
@@ -36,10 +40,29 @@ def _assets_dir() -> pathlib.Path:
     return base / "assets"
 
 
-def _settings_path() -> pathlib.Path:
-    """Return path to the persistent UI settings JSON file."""
+@lru_cache(maxsize=1)
+def _settings_dir() -> pathlib.Path:
+    """Return the directory holding persistent UI settings files."""
     base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
-    return pathlib.Path(base) / "NotMetaPromptLibrary" / "settings.json"
+    return pathlib.Path(base) / "NotMetaPromptLibrary"
+
+
+@lru_cache(maxsize=1)
+def _geometry_path() -> pathlib.Path:
+    """Window geometry + sash position (written on drag release / close)."""
+    return _settings_dir() / "geometry.json"
+
+
+@lru_cache(maxsize=1)
+def _panels_path() -> pathlib.Path:
+    """Panel visibility bits (written on toggle)."""
+    return _settings_dir() / "panels.json"
+
+
+@lru_cache(maxsize=1)
+def _legacy_settings_path() -> pathlib.Path:
+    """Pre-split single settings.json – still read as a fallback."""
+    return _settings_dir() / "settings.json"
 
 
 class MainWindow(ctk.CTk):
@@ -49,6 +72,23 @@ class MainWindow(ctk.CTk):
     _MIN_COMPOSE_WIDTH: int = 340
     _DEFAULT_LIB_WIDTH: int = 420
 
+    # Pre-built toggle-button styles – one configure(**style) per flip
+    # instead of rebuilding the same kwargs dict on every toggle.
+    _BTN_ON_STYLE: dict = {
+        "fg_color": AppTheme.BTN_PRIMARY_BG,
+        "text_color": AppTheme.BTN_PRIMARY_FG,
+        "hover_color": AppTheme.BTN_PRIMARY_HOVER,
+    }
+    _BTN_OFF_STYLE: dict = {
+        "fg_color": AppTheme.BTN_SECONDARY_BG,
+        "text_color": AppTheme.FG_MUTED,
+        "hover_color": AppTheme.BG_HOVER,
+    }
+    _LIB_BTN_ON: dict = {"text": "◀ Library", **_BTN_ON_STYLE}
+    _LIB_BTN_OFF: dict = {"text": "▶ Library", **_BTN_OFF_STYLE}
+    _COMPOSE_BTN_ON: dict = {"text": "Compose ▶", **_BTN_ON_STYLE}
+    _COMPOSE_BTN_OFF: dict = {"text": "Compose ◀", **_BTN_OFF_STYLE}
+
     def __init__(self) -> None:
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("dark-blue")
@@ -67,9 +107,38 @@ class MainWindow(ctk.CTk):
         self._lib_visible: bool = True
         self._compose_visible: bool = True
 
+        # Debounced settings-save state; the actual file writes run on a
+        # daemon writer thread fed by a queue of (path, dict) jobs,
+        # keeping JSON serialization + disk latency off the event loop.
+        self._save_after_id: Optional[str] = None
+        # Split files: a toggle rewrites only panels.json, a sash drag only
+        # geometry.json. Each gets its own unchanged-skip cache.
+        self._last_saved_geometry: Optional[dict] = None
+        self._last_saved_panels: Optional[dict] = None
+        self._suppress_save = False
+
+        # Session state parsed by _load_settings, applied in one pass
+        self._pending_sash: Optional[int] = None
+        self._pending_lib_hidden = False
+        self._pending_compose_hidden = False
+        self._save_queue: queue.Queue = queue.Queue()
+        self._settings_writer = threading.Thread(target=self._settings_writer_loop, daemon=True)
+        self._settings_writer.start()
+
         # ── Services ──────────────────────────────────────────────────
+        # Imported here rather than at module top so the root window can
+        # paint before the heavier service/panel subsystems load.
+        from services.storage_service import StorageService
+        from services.prompt_service import PromptService
+        from services.compose_service import ComposeService
+        from services.clipboard_service import ClipboardService
+        from ui.panels.library_panel import LibraryPanel
+        from ui.panels.compose_panel import ComposePanel
+
         storage = StorageService()
-        prompt_svc = PromptService(storage)
+        prompt_svc = PromptService(storage, scheduler=self.after)
+        self._storage = storage
+        self._prompt_svc = prompt_svc
         compose_svc = ComposeService()
         clip_svc = ClipboardService(self)
 
@@ -119,7 +188,8 @@ class MainWindow(ctk.CTk):
         )
 
         # Save sash position whenever the user releases a drag
-        self._paned.bind("<ButtonRelease-1>", lambda _e: self._save_settings())
+        self._last_sash_x: Optional[int] = None
+        self._paned.bind("<ButtonRelease-1>", lambda _e: self._on_sash_release())
 
         # Load persisted geometry + sash after the window is drawn
         self.after(60, self._load_settings)
@@ -183,12 +253,7 @@ class MainWindow(ctk.CTk):
         if self._lib_visible:
             self._paned.forget(self._library_panel)
             self._lib_visible = False
-            self._lib_toggle_btn.configure(
-                text="▶ Library",
-                fg_color=AppTheme.BTN_SECONDARY_BG,
-                text_color=AppTheme.FG_MUTED,
-                hover_color=AppTheme.BG_HOVER,
-            )
+            self._lib_toggle_btn.configure(**self._LIB_BTN_OFF)
         else:
             if self._compose_visible:
                 # Must insert at index 0 so library is left of compose
@@ -227,25 +292,15 @@ class MainWindow(ctk.CTk):
                     sticky="nsew",
                 )
             self._lib_visible = True
-            self._lib_toggle_btn.configure(
-                text="◀ Library",
-                fg_color=AppTheme.BTN_PRIMARY_BG,
-                text_color=AppTheme.BTN_PRIMARY_FG,
-                hover_color=AppTheme.BTN_PRIMARY_HOVER,
-            )
-        self._save_settings()
+            self._lib_toggle_btn.configure(**self._LIB_BTN_ON)
+        self._schedule_save()
 
     def _toggle_compose(self) -> None:
         """Show or hide the compose panel (Ctrl+])."""
         if self._compose_visible:
             self._paned.forget(self._compose_panel)
             self._compose_visible = False
-            self._compose_toggle_btn.configure(
-                text="Compose ◀",
-                fg_color=AppTheme.BTN_SECONDARY_BG,
-                text_color=AppTheme.FG_MUTED,
-                hover_color=AppTheme.BG_HOVER,
-            )
+            self._compose_toggle_btn.configure(**self._COMPOSE_BTN_OFF)
         else:
             self._paned.add(
                 self._compose_panel,
@@ -254,13 +309,8 @@ class MainWindow(ctk.CTk):
                 sticky="nsew",
             )
             self._compose_visible = True
-            self._compose_toggle_btn.configure(
-                text="Compose ▶",
-                fg_color=AppTheme.BTN_PRIMARY_BG,
-                text_color=AppTheme.BTN_PRIMARY_FG,
-                hover_color=AppTheme.BTN_PRIMARY_HOVER,
-            )
-        self._save_settings()
+            self._compose_toggle_btn.configure(**self._COMPOSE_BTN_ON)
+        self._schedule_save()
 
     # ------------------------------------------------------------------
     # Keyboard shortcuts
@@ -282,29 +332,91 @@ class MainWindow(ctk.CTk):
     def _load_settings(self) -> None:
         """Restore geometry, sash position and panel visibility from last session."""
         try:
-            path = _settings_path()
-            if not path.exists():
-                return
-            raw: dict[str, object] = json.loads(path.read_text(encoding="utf-8"))
+            geo_raw = self._read_settings_file(_geometry_path())
+            panels_raw = self._read_settings_file(_panels_path())
+            if geo_raw is None and panels_raw is None:
+                # Fall back to the pre-split single settings.json
+                legacy = self._read_settings_file(_legacy_settings_path()) or {}
+                geo_raw = panels_raw = legacy
+                if not legacy:
+                    return
+            geo_raw = geo_raw or {}
+            panels_raw = panels_raw or {}
+            self._last_saved_geometry = {
+                "geometry": geo_raw.get("geometry"),
+                "sash_pos": geo_raw.get("sash_pos"),
+            }
+            self._last_saved_panels = {
+                "lib_visible": panels_raw.get("lib_visible"),
+                "compose_visible": panels_raw.get("compose_visible"),
+            }
 
-            geometry = raw.get("geometry")
+            geometry = geo_raw.get("geometry")
             if isinstance(geometry, str) and geometry:
                 self.geometry(geometry)
 
-            sash_pos = raw.get("sash_pos")
-            if isinstance(sash_pos, int) and self._lib_visible and self._compose_visible:
-                self.after(120, lambda: self._paned.sash_place(0, sash_pos, 0))
+            sash_pos = geo_raw.get("sash_pos")
+            self._pending_sash = sash_pos if isinstance(sash_pos, int) else None
+            self._pending_lib_hidden = panels_raw.get("lib_visible") is False
+            self._pending_compose_hidden = panels_raw.get("compose_visible") is False
 
-            if raw.get("lib_visible") is False:
-                self.after(200, self._toggle_library)
-            if raw.get("compose_visible") is False:
-                self.after(220, self._toggle_compose)
+            # One deferred wakeup applies sash + visibility together –
+            # a single relayout pass instead of three queued callbacks.
+            if self._pending_sash is not None or self._pending_lib_hidden or self._pending_compose_hidden:
+                self.after(120, self._apply_restored_state)
 
         except Exception:  # noqa: BLE001 – intentional: never crash on bad settings
             pass
 
-    def _save_settings(self) -> None:
-        """Persist geometry, sash position and panel visibility."""
+    def _apply_restored_state(self) -> None:
+        """Apply restored sash position and panel visibility in one pass."""
+        self._suppress_save = True
+        try:
+            if self._pending_lib_hidden and self._lib_visible:
+                self._toggle_library()
+            if self._pending_compose_hidden and self._compose_visible:
+                self._toggle_compose()
+            if self._pending_sash is not None and self._lib_visible and self._compose_visible:
+                try:
+                    self._paned.sash_place(0, self._pending_sash, 0)
+                    self._last_sash_x = self._pending_sash
+                except tk.TclError:
+                    pass
+        finally:
+            self._suppress_save = False
+        self._flush_save()
+
+    def _on_sash_release(self) -> None:
+        """Schedule a save only when the sash actually moved.
+
+        <ButtonRelease-1> fires for any click inside the paned window,
+        not just sash drags, so compare against the last known position.
+        """
+        try:
+            x = self._paned.sash_coord(0)[0]
+        except tk.TclError:
+            return
+        if x == self._last_sash_x:
+            return
+        self._last_sash_x = x
+        self._schedule_save()
+
+    def _schedule_save(self, delay_ms: int = 300) -> None:
+        """Coalesce a burst of setting changes into one deferred write."""
+        if self._save_after_id:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(delay_ms, self._flush_save)
+
+    def _flush_save(self) -> None:
+        """Persist geometry, sash position and panel visibility.
+
+        Each half goes to its own small file and is enqueued only when its
+        contents actually changed, so a toggle never rewrites geometry and
+        a sash drag never rewrites panel state.
+        """
+        if self._suppress_save:
+            return  # mid-restore: _apply_restored_state saves once at the end
+        self._save_after_id = None
         try:
             sash_pos: Optional[int] = None
             if self._lib_visible and self._compose_visible:
@@ -314,23 +426,63 @@ class MainWindow(ctk.CTk):
                 except tk.TclError:
                     pass
 
-            settings: dict[str, object] = {
+            geometry_settings: dict[str, object] = {
                 "geometry": self.geometry(),
                 "sash_pos": sash_pos,
+            }
+            panel_settings: dict[str, object] = {
                 "lib_visible": self._lib_visible,
                 "compose_visible": self._compose_visible,
             }
-            path = _settings_path()
+            if geometry_settings != self._last_saved_geometry:
+                self._save_queue.put((_geometry_path(), geometry_settings))
+                self._last_saved_geometry = geometry_settings
+            if panel_settings != self._last_saved_panels:
+                self._save_queue.put((_panels_path(), panel_settings))
+                self._last_saved_panels = panel_settings
+        except Exception:  # noqa: BLE001
+            pass
+
+    def _settings_writer_loop(self) -> None:
+        while True:
+            job = self._save_queue.get()
+            if job is None:  # shutdown sentinel
+                return
+            path, settings = job
+            self._write_settings_file(path, settings)
+
+    @staticmethod
+    def _read_settings_file(path: pathlib.Path) -> Optional[dict]:
+        """Read + decode one settings file, or None if it is missing/bad."""
+        try:
+            with open(path, "rb", buffering=65536) as f:
+                data = f.read()
+            return orjson.loads(data) if orjson else json.loads(data)
+        except Exception:  # noqa: BLE001
+            return None
+
+    @staticmethod
+    def _write_settings_file(path: pathlib.Path, settings: dict) -> None:
+        try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(
-                json.dumps(settings, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            # Stream into a buffered temp file and rename atomically, so a
+            # crash mid-save can never leave a half-written settings file.
+            tmp = path.with_suffix(".json.tmp")
+            with open(tmp, "wb", buffering=64 * 1024) as f:
+                with io.TextIOWrapper(f, encoding="utf-8") as wrapper:
+                    json.dump(settings, wrapper, ensure_ascii=False, indent=2)
+            os.replace(tmp, path)
         except Exception:  # noqa: BLE001
             pass
 
     def _on_close(self) -> None:
-        self._save_settings()
+        if self._save_after_id:
+            self.after_cancel(self._save_after_id)
+        self._flush_save()
+        self._save_queue.put(None)  # sentinel: drain + stop settings writer
+        self._settings_writer.join(timeout=1.0)
+        self._prompt_svc.flush()
+        self._storage.close()  # drain the background writer before exit
         self.destroy()
 
     # ------------------------------------------------------------------
@@ -338,9 +490,14 @@ class MainWindow(ctk.CTk):
     # ------------------------------------------------------------------
 
     def _set_icon(self) -> None:
+        # .ico iconbitmap is Windows-only; elsewhere it's a no-op/error,
+        # so skip the path work and stat entirely.
+        if sys.platform != "win32":
+            return
         ico_path = _assets_dir() / "icon.ico"
-        if ico_path.exists():
-            try:
-                self.iconbitmap(str(ico_path))
-            except Exception:  # noqa: BLE001
-                pass
+        try:
+            # No exists() pre-check – iconbitmap raises TclError on a
+            # missing file, which we swallow anyway.
+            self.iconbitmap(str(ico_path))
+        except (tk.TclError, OSError):
+            pass
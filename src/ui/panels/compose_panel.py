@@ -9,7 +9,8 @@ No persistence, no terminal injection.
 
 from __future__ import annotations
 
-from typing import List, Optional
+import threading
+from typing import Callable, List, Optional
 import customtkinter as ctk
 
 from models.prompt import Prompt, PromptRole
@@ -22,6 +23,21 @@ from ui.widgets.drag_sort_list import DragSortableList
 
 _TOAST_MS = 1800
 
+# value → enum, so the per-keystroke separator lookup is one dict get
+# instead of EnumMeta.__call__ wrapped in try/except
+_SEP_BY_VALUE = {s.value: s for s in ComposeSeparator}
+
+_PREVIEW_PLACEHOLDER = "Select prefixes/suffixes or type a body…"
+
+# Hot-path theme colours bound once at import; _update_preview runs per
+# keystroke and class-attribute lookups add up there. One-time _build
+# styling keeps the normal AppTheme access.
+_FG_MAIN = AppTheme.FG_MAIN
+_FG_MUTED = AppTheme.FG_MUTED
+
+# Sentinel preview key for the idle everything-empty state
+_EMPTY = object()
+
 
 class ComposePanel(ctk.CTkFrame):
     """Compose panel: prefix checks + body + suffix checks + copy."""
@@ -39,15 +55,46 @@ class ComposePanel(ctk.CTkFrame):
         self._compose = compose_service
         self._clip = clipboard
         self._toast_job: Optional[str] = None
+        self._preview_job: Optional[str] = None
+        # Last preview input signature + displayed text, to skip redundant
+        # recomputes and label redraws (arrow keys, focus events, …)
+        self._preview_key: Optional[tuple] = None
+        self._preview_text: Optional[str] = None
+        # Body text mirrored out of Tcl on <<Modified>> so preview/compose
+        # never round-trip the whole textbox content per keystroke
+        self._body_cache = ""
+        # Selector shape signatures – see _refresh_selectors
+        self._prefix_sig: Optional[tuple] = None
+        self._suffix_sig: Optional[tuple] = None
+        # Set when a preview refresh arrives while the panel is hidden
+        self._preview_dirty = False
+        # Currently applied label colours/text – configure() redraws the
+        # canvas even for unchanged values, so only pass what changed
+        self._preview_color: Optional[str] = None
+        self._toast_text: Optional[str] = None
+        self._custom_entry_enabled = False  # mirrors the entry's state option
 
         self._sep_var = ctk.StringVar(value=ComposeSeparator.NEWLINE.value)
         self._custom_sep_var = ctk.StringVar(value=" | ")
 
+        # Shared CTkFont instances – each font tuple passed to a widget
+        # otherwise becomes a fresh Tk font object per construction
+        self._font_ui_sm = ctk.CTkFont(family=AppTheme.FONT_FAMILY_UI, size=AppTheme.FONT_SIZE_SM)
+        self._font_ui_xs = ctk.CTkFont(family=AppTheme.FONT_FAMILY_UI, size=AppTheme.FONT_SIZE_XS)
+        self._font_mono_sm = ctk.CTkFont(family=AppTheme.FONT_FAMILY, size=AppTheme.FONT_SIZE_SM)
+        self._font_mono_sm_bold = ctk.CTkFont(
+            family=AppTheme.FONT_FAMILY, size=AppTheme.FONT_SIZE_SM, weight="bold"
+        )
+
         self._build()
         self._svc.subscribe(self._on_state_changed)
         self._refresh_selectors()
         # Trace custom separator text changes so preview stays live
-        self._custom_sep_var.trace_add("write", lambda *_: self._update_preview())
+        self._custom_sep_var.trace_add("write", lambda *_: self._schedule_preview())
+        # Catch up on preview refreshes that arrived while hidden
+        self._preview_lbl.bind(
+            "<Map>", lambda _e: self._update_preview() if self._preview_dirty else None
+        )
 
     # ------------------------------------------------------------------
     # Build
@@ -74,7 +121,7 @@ class ComposePanel(ctk.CTkFrame):
             fg_color=AppTheme.BTN_SECONDARY_BG,
             text_color=AppTheme.FG_MUTED,
             hover_color=AppTheme.BG_HOVER,
-            font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM),
+            font=self._font_ui_sm,
             corner_radius=AppTheme.BTN_CORNER,
             command=self._clear_all_selections,
         ).pack(side="right", padx=pad, pady=8)
@@ -97,7 +144,7 @@ class ComposePanel(ctk.CTkFrame):
         self._prefix_list = DragSortableList(
             self._scroll,
             role="prefix",
-            on_change=self._update_preview,
+            on_change=self._schedule_preview,
             on_copy=self._copy_single,
             on_reorder=None,
         )
@@ -113,7 +160,7 @@ class ComposePanel(ctk.CTkFrame):
             border_color=AppTheme.BORDER_ACCENT,
             border_width=1,
             text_color=AppTheme.FG_MAIN,
-            font=(AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_SM),
+            font=self._font_mono_sm,
             height=140,
             wrap="word",
         )
@@ -126,7 +173,7 @@ class ComposePanel(ctk.CTkFrame):
             fg_color=AppTheme.BTN_COPY_BG,
             text_color=AppTheme.BTN_COPY_FG,
             hover_color=AppTheme.BG_HOVER,
-            font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM),
+            font=self._font_ui_sm,
             corner_radius=AppTheme.BTN_CORNER,
             command=self._copy_body_only,
         ).pack(fill="x", padx=pad, pady=(0, 8))
@@ -138,7 +185,7 @@ class ComposePanel(ctk.CTkFrame):
         self._suffix_list = DragSortableList(
             self._scroll,
             role="suffix",
-            on_change=self._update_preview,
+            on_change=self._schedule_preview,
             on_copy=self._copy_single,
             on_reorder=None,
         )
@@ -162,7 +209,7 @@ class ComposePanel(ctk.CTkFrame):
                 text_color=AppTheme.FG_MAIN,
                 fg_color=AppTheme.FG_ACCENT,
                 border_color=AppTheme.BORDER,
-                font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM),
+                font=self._font_ui_sm,
                 command=self._on_sep_changed,
             ).pack(anchor="w", padx=pad, pady=5)
 
@@ -173,7 +220,7 @@ class ComposePanel(ctk.CTkFrame):
             fg_color=AppTheme.BG_INPUT,
             border_color=AppTheme.BORDER,
             text_color=AppTheme.FG_MAIN,
-            font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM),
+            font=self._font_ui_sm,
             height=36,
             state="disabled",
         )
@@ -188,33 +235,34 @@ class ComposePanel(ctk.CTkFrame):
             fg_color=AppTheme.BG_CARD,
             corner_radius=AppTheme.CARD_CORNER,
             text_color=AppTheme.FG_MUTED,
-            font=(AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_SM),
+            font=self._font_mono_sm,
             anchor="nw",
             justify="left",
             wraplength=420,
         )
         self._preview_lbl.pack(fill="x", padx=pad, pady=(0, pad))
 
-        # Bind body changes to preview
-        self._body_text.bind("<KeyRelease>", lambda _: self._update_preview())
+        # Mirror body edits into _body_cache (one Tcl fetch per real change,
+        # not per keystroke) and schedule a debounced preview refresh
+        self._body_text.bind("<<Modified>>", self._on_body_modified)
 
         # ── Fixed bottom bar (always visible, outside scroll) ─────────
         ctk.CTkFrame(self, fg_color=AppTheme.DIVIDER_COLOR, height=1, corner_radius=0).pack(
             fill="x", side="bottom"
         )
 
-        # Toast bar – hidden until needed
+        # Toast bar – permanently packed; shown/hidden by toggling its
+        # height+text via configure so the layout never re-packs
         self._toast_lbl = ctk.CTkLabel(
             self,
             text="",
             fg_color=AppTheme.BG_SELECTED,
             corner_radius=0,
             text_color=AppTheme.FG_ACCENT,
-            font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM),
+            font=self._font_ui_sm,
             anchor="center",
-            height=28,
+            height=0,
         )
-        # (not packed initially – shown by _toast())
 
         # Compose & Copy CTA – always visible at panel bottom
         ctk.CTkButton(
@@ -229,26 +277,29 @@ class ComposePanel(ctk.CTkFrame):
             command=self._handle_compose_and_copy,
         ).pack(fill="x", side="bottom")
 
+        # Packed last so it sits topmost of the bottom stack, exactly
+        # where _toast used to pack it on demand
+        self._toast_lbl.pack(fill="x", side="bottom")
+
     # ------------------------------------------------------------------
     # Section header helper
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _section_header(parent, title: str, color: str, subtitle: str) -> None:
+    def _section_header(self, parent, title: str, color: str, subtitle: str) -> None:
         pad = AppTheme.PANEL_PAD
         lbl_frame = ctk.CTkFrame(parent, fg_color="transparent")
         lbl_frame.pack(fill="x", padx=pad, pady=(8, 2))
         ctk.CTkLabel(
             lbl_frame,
             text=title,
-            font=(AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_SM, "bold"),
+            font=self._font_mono_sm_bold,
             text_color=color,
         ).pack(side="left")
         if subtitle:
             ctk.CTkLabel(
                 lbl_frame,
                 text=f"  {subtitle}",
-                font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_XS),
+                font=self._font_ui_xs,
                 text_color=AppTheme.FG_MUTED,
             ).pack(side="left")
 
@@ -256,24 +307,103 @@ class ComposePanel(ctk.CTkFrame):
     # Refresh selectors when library changes
     # ------------------------------------------------------------------
 
-    def _refresh_selectors(self, _state: Optional[LibraryState] = None) -> None:
-        self._prefix_list.set_items(self._svc.get_by_role(PromptRole.PREFIX))
-        self._suffix_list.set_items(self._svc.get_by_role(PromptRole.SUFFIX))
-        self._update_preview()
+    def _refresh_selectors(self, state: Optional[LibraryState] = None) -> None:
+        # One pass over the library splits both roles (get_by_role would
+        # scan the whole list twice).
+        prompts = (state or self._svc.state).prompts
+        prefixes: List[Prompt] = []
+        suffixes: List[Prompt] = []
+        for p in prompts:
+            if p.role is PromptRole.PREFIX:
+                prefixes.append(p)
+            elif p.role is PromptRole.SUFFIX:
+                suffixes.append(p)
+        # Rebuild a selector only when its visible shape (ids + names)
+        # changed; otherwise just swap the data refs. Keeps compose+copy
+        # usage bumps from tearing the rows down.
+        prefix_sig = tuple((p.id, p.name) for p in prefixes)
+        suffix_sig = tuple((s.id, s.name) for s in suffixes)
+        if prefix_sig != self._prefix_sig:
+            self._prefix_sig = prefix_sig
+            self._prefix_list.set_items(prefixes)
+        else:
+            self._prefix_list.sync_items(prefixes)
+        if suffix_sig != self._suffix_sig:
+            self._suffix_sig = suffix_sig
+            self._suffix_list.set_items(suffixes)
+        else:
+            self._suffix_list.sync_items(suffixes)
+        self._schedule_preview()
 
     # ------------------------------------------------------------------
     # Preview
     # ------------------------------------------------------------------
 
+    def _on_body_modified(self, _event: object = None) -> None:
+        self._body_cache = self._body_text.get("1.0", "end-1c")
+        self._body_text.edit_modified(False)  # re-arm the virtual event
+        self._schedule_preview()
+
+    def _schedule_preview(self) -> None:
+        """Coalesce preview recomputes to ~12 Hz during typing bursts."""
+        if self._preview_job:
+            self.after_cancel(self._preview_job)
+        self._preview_job = self.after(80, self._run_preview)
+
+    def _run_preview(self) -> None:
+        self._preview_job = None
+        self._update_preview()
+
     def _update_preview(self) -> None:
+        # Hidden panel (toggled away / unmapped): defer the whole refresh
+        # until <Map> instead of composing and redrawing into the void.
+        if not self._preview_lbl.winfo_ismapped():
+            self._preview_dirty = True
+            return
+        self._preview_dirty = False
+
         prefixes = self._prefix_list.get_checked_in_order()
         suffixes = self._suffix_list.get_checked_in_order()
-        body = self._body_text.get("1.0", "end-1c")
+        body = self._body_cache
+
+        # Idle fast path: nothing selected, nothing typed – the common
+        # state for every library broadcast at startup
+        if not prefixes and not suffixes and (not body or body.isspace()):
+            if self._preview_key is not _EMPTY:
+                self._preview_key = _EMPTY
+                self._preview_text = _PREVIEW_PLACEHOLDER
+                if self._preview_color == _FG_MUTED:
+                    self._preview_lbl.configure(text=_PREVIEW_PLACEHOLDER)
+                else:
+                    self._preview_color = _FG_MUTED
+                    self._preview_lbl.configure(text=_PREVIEW_PLACEHOLDER, text_color=_FG_MUTED)
+            return
+
         sep, custom = self._current_separator()
 
+        # updated_at rides along in the key so content edits invalidate it
+        key = (
+            tuple((p.id, p.updated_at) for p in prefixes),
+            body,
+            tuple((s.id, s.updated_at) for s in suffixes),
+            sep.value,
+            custom if sep is ComposeSeparator.CUSTOM else "",
+        )
+        if key == self._preview_key:
+            return
+        self._preview_key = key
+
         preview = self._compose.preview(prefixes, body, suffixes, sep, custom)
-        display = preview if preview.strip() else "Select prefixes/suffixes or type a body…"
-        self._preview_lbl.configure(text=display, text_color=AppTheme.FG_MAIN if preview.strip() else AppTheme.FG_MUTED)
+        display = preview if preview.strip() else _PREVIEW_PLACEHOLDER
+        if display == self._preview_text:
+            return  # same rendered text – skip the canvas redraw
+        self._preview_text = display
+        new_color = _FG_MAIN if preview.strip() else _FG_MUTED
+        if new_color == self._preview_color:
+            self._preview_lbl.configure(text=display)
+        else:
+            self._preview_color = new_color
+            self._preview_lbl.configure(text=display, text_color=new_color)
 
     # ------------------------------------------------------------------
     # Compose & Copy
@@ -290,7 +420,7 @@ class ComposePanel(ctk.CTkFrame):
     def _handle_compose_and_copy(self) -> None:
         prefixes = self._prefix_list.get_checked_in_order()
         suffixes = self._suffix_list.get_checked_in_order()
-        body = self._body_text.get("1.0", "end-1c")
+        body = self._body_cache
         sep, custom = self._current_separator()
 
         composed = self._compose.compose(prefixes, body, suffixes, sep, custom)
@@ -298,31 +428,53 @@ class ComposePanel(ctk.CTkFrame):
             self._toast("Nothing to copy — add prefixes, body, or suffixes first.")
             return
 
-        # Increment usage for all selected
-        for prompt in prefixes + suffixes:
-            self._svc.increment_usage(prompt.id)
-
-        if self._clip.copy(composed):
-            parts = []
-            if prefixes:
-                parts.append(f"{len(prefixes)} prefix{'es' if len(prefixes) > 1 else ''}")
-            if body.strip():
-                parts.append("body")
-            if suffixes:
-                parts.append(f"{len(suffixes)} suffix{'es' if len(suffixes) > 1 else ''}")
-            self._toast("Composed & copied: " + " + ".join(parts))
-        else:
-            self._toast("Clipboard write failed.")
+        # Increment usage for all selected – one mutation, one broadcast
+        self._svc.increment_usage_many([p.id for p in prefixes + suffixes])
+
+        parts = []
+        if prefixes:
+            parts.append(f"{len(prefixes)} prefix{'es' if len(prefixes) > 1 else ''}")
+        if body.strip():
+            parts.append("body")
+        if suffixes:
+            parts.append(f"{len(suffixes)} suffix{'es' if len(suffixes) > 1 else ''}")
+        success_msg = "Composed & copied: " + " + ".join(parts)
+        self._copy_async(
+            composed,
+            lambda ok: self._toast(success_msg if ok else "Clipboard write failed."),
+        )
 
     def _copy_body_only(self) -> None:
-        body = self._body_text.get("1.0", "end-1c")
-        if body.strip() and self._clip.copy(body):
-            self._toast("Body copied.")
+        body = self._body_cache
+        if body.strip():
+            self._copy_async(
+                body, lambda ok: self._toast("Body copied." if ok else "Clipboard write failed.")
+            )
 
     def _copy_single(self, prompt: Prompt) -> None:
-        if self._clip.copy(prompt.content):
+        self._copy_async(prompt.content, lambda ok: self._after_copy_single(prompt, ok))
+
+    def _after_copy_single(self, prompt: Prompt, ok: bool) -> None:
+        """UI-thread continuation: only a successful copy counts as usage."""
+        if ok:
             self._svc.increment_usage(prompt.id)
             self._toast(f"Copied: {prompt.name}")
+        else:
+            self._toast("Clipboard write failed.")
+
+    def _copy_async(self, text: str, on_done: Callable[[bool], None]) -> None:
+        """Write to the clipboard on a worker thread.
+
+        X11/Wayland clipboard handshakes can block for tens of ms; the
+        result is marshalled back to the UI thread via after(0, ...).
+        State mutations must stay on the UI thread – do them before
+        dispatching or inside on_done.
+        """
+        def worker() -> None:
+            ok = self._clip.copy(text)
+            self.after(0, on_done, ok)
+
+        threading.Thread(target=worker, daemon=True).start()
 
     # ------------------------------------------------------------------
     # Helpers
@@ -331,22 +483,21 @@ class ComposePanel(ctk.CTkFrame):
     def _clear_all_selections(self) -> None:
         self._prefix_list.clear_all()
         self._suffix_list.clear_all()
-        self._update_preview()
+        self._schedule_preview()
 
     def _current_separator(self):
-        sep_val = self._sep_var.get()
-        try:
-            sep = ComposeSeparator(sep_val)
-        except ValueError:
-            sep = ComposeSeparator.NEWLINE
+        sep = _SEP_BY_VALUE.get(self._sep_var.get(), ComposeSeparator.NEWLINE)
         custom = self._custom_sep_var.get()
         return sep, custom
 
     def _on_sep_changed(self) -> None:
         is_custom = self._sep_var.get() == ComposeSeparator.CUSTOM.value
-        state = "normal" if is_custom else "disabled"
-        self._custom_sep_entry.configure(state=state)
-        self._update_preview()
+        # Clicking the already-selected radio fires this too – skip the
+        # state repaint when nothing flips
+        if is_custom != self._custom_entry_enabled:
+            self._custom_entry_enabled = is_custom
+            self._custom_sep_entry.configure(state="normal" if is_custom else "disabled")
+        self._schedule_preview()
 
     # ------------------------------------------------------------------
     # Observer
@@ -362,11 +513,15 @@ class ComposePanel(ctk.CTkFrame):
     def _toast(self, message: str) -> None:
         if self._toast_job:
             self.after_cancel(self._toast_job)
-        self._toast_lbl.configure(text=f"  ✓ {message}  ")
-        # pack above the divider (both use side="bottom", so last-packed = topmost)
-        self._toast_lbl.pack(fill="x", side="bottom")
+        text = f"  ✓ {message}  "
+        if text != self._toast_text:
+            self._toast_text = text
+            self._toast_lbl.configure(text=text, height=28)
+        else:
+            self._toast_lbl.configure(height=28)
         self._toast_job = self.after(_TOAST_MS, self._hide_toast)
 
     def _hide_toast(self) -> None:
-        self._toast_lbl.pack_forget()
+        self._toast_lbl.configure(text="", height=0)
+        self._toast_text = None
         self._toast_job = None
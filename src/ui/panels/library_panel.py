@@ -10,9 +10,11 @@ when selection changes so ComposePanel can refresh.
 from __future__ import annotations
 
 import json
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from typing import Callable, List, Optional
+from tkinter import font as tkfont
+from typing import Callable, Dict, List, Optional
 
 import customtkinter as ctk
 
@@ -30,6 +32,18 @@ OnSelectionChanged = Callable[[List[Prompt]], None]
 _TOAST_MS = 1800
 _ALL_CHIP = "All"
 
+# Cards rendered per virtualization window; more are materialized as the
+# user scrolls toward the bottom of the list.
+_RENDER_CHUNK = 40
+
+# Parked cards kept for rebinding; beyond this the surplus is destroyed
+# so heavy filter churn can't accumulate widgets without bound.
+_CARD_POOL_MAX = 60
+
+# New-card constructions per event-loop turn: larger loads yield back to
+# the mainloop between batches so the window stays responsive.
+_BUILD_BATCH = 12
+
 
 class LibraryPanel(ctk.CTkFrame):
     """Scrollable prompt library with toolbar."""
@@ -49,11 +63,42 @@ class LibraryPanel(ctk.CTkFrame):
         self._storage = storage
         self._on_selection_changed = on_selection_changed
         self._toast_job: Optional[str] = None
-        self._cards: List[PromptCard] = []
+        self._search_after_job: Optional[str] = None
+        # Live cards keyed by prompt id + a free-list of parked widgets;
+        # refreshes rebind cards in place instead of reconstructing them
+        self._cards: Dict[int, PromptCard] = {}
+        self._card_pool: List[PromptCard] = []
+        self._empty_lbl: Optional[ctk.CTkLabel] = None
+        # Last query + its matches: a narrowing query ("des" after "de")
+        # only rescans the previous (small) result set
+        self._last_query: str = ""
+        self._last_category: Optional[str] = None
+        self._last_result: List[Prompt] = []
+        # Chip widgets keyed by category + last seen set/active state
+        self._chip_widgets: Dict[str, ctk.CTkButton] = {}
+        self._last_chip_cats: Optional[tuple] = None
+        self._last_active_chip: object = object()
+        # Virtualization window: only the first _render_limit ranked cards
+        # exist as widgets; scrolling near the bottom extends the window
+        self._render_limit = _RENDER_CHUNK
+        self._window_sig: tuple = ("", None)
+        self._ranked_count = 0
+        # Observable-state signature: mutations that leave it unchanged
+        # (usage bumps from copy clicks) skip the card resync entirely
+        self._last_signature: tuple = ()
+        self._last_shown_count = 0
+        # Burst-notification coalescing (one idle refresh per burst)
+        self._refresh_pending = False
+        self._latest_state: Optional[LibraryState] = None
+        # Chunked card-construction state (see _continue_sync)
+        self._build_after_id: Optional[str] = None
+        self._sync_list: List[Prompt] = []
+        self._sync_pos = 0
         self._active_category: Optional[str] = None   # None = All
         self._search_entry: Optional[ctk.CTkEntry] = None
 
         self._build()
+        self._recompute_state_caches(self._svc.state)
         self._svc.subscribe(self._on_state_changed)
         self._refresh_list()
 
@@ -110,7 +155,7 @@ class LibraryPanel(ctk.CTkFrame):
         search_frame.pack(fill="x")
 
         self._search_var = ctk.StringVar()
-        self._search_var.trace_add("write", lambda *_: self._refresh_list())
+        self._search_var.trace_add("write", lambda *_: self._schedule_refresh())
         self._search_entry = ctk.CTkEntry(
             search_frame,
             textvariable=self._search_var,
@@ -136,6 +181,14 @@ class LibraryPanel(ctk.CTkFrame):
         )
         self._chips_scroll.pack(fill="x", padx=pad, pady=(0, 4))
 
+        # Real font metrics for chip widths – len(cat)*9 guesses wrong for
+        # non-ASCII text and forces Tk to resize chips after the fact.
+        # Measured bold (the active style) so both states fit.
+        self._chip_font = tkfont.Font(
+            family=AppTheme.FONT_FAMILY_UI, size=AppTheme.FONT_SIZE_SM, weight="bold"
+        )
+        self._chip_width_cache: Dict[str, int] = {}
+
         # Divider
         ctk.CTkFrame(self, fg_color=AppTheme.DIVIDER_COLOR, height=1, corner_radius=0).pack(fill="x")
 
@@ -156,6 +209,18 @@ class LibraryPanel(ctk.CTkFrame):
         )
         self._scroll.pack(fill="both", expand=True, padx=0, pady=0)
 
+        # Chain the canvas scroll feedback so nearing the bottom of the
+        # rendered window materializes the next chunk of cards
+        canvas = self._scroll._parent_canvas
+        scrollbar_set = self._scroll._scrollbar.set
+
+        def _on_scroll(lo: str, hi: str) -> None:
+            scrollbar_set(lo, hi)
+            if float(hi) > 0.9 and self._render_limit < self._ranked_count:
+                self._extend_render_window()
+
+        canvas.configure(yscrollcommand=_on_scroll)
+
         # ── Footer ────────────────────────────────────────────────────
         self._stats_lbl = ctk.CTkLabel(
             self, text="",
@@ -184,33 +249,50 @@ class LibraryPanel(ctk.CTkFrame):
     # Category chips
     # ------------------------------------------------------------------
 
-    def _refresh_chips(self, prompts: List[Prompt]) -> None:
-        """Rebuild category chip buttons from current prompt categories."""
-        for w in self._chips_scroll.winfo_children():
-            w.destroy()
-
-        categories = [_ALL_CHIP] + sorted(
-            {p.category for p in self._svc.get_all() if p.category}
-        )
-
-        for cat in categories:
+    def _refresh_chips(self) -> None:
+        """Sync category chips: rebuild only when the category set changed,
+        otherwise just retint for the active selection."""
+        categories = tuple([_ALL_CHIP] + self._sorted_categories)
+
+        if categories != self._last_chip_cats:
+            self._last_chip_cats = categories
+            for w in self._chip_widgets.values():
+                w.destroy()
+            self._chip_widgets.clear()
+            for cat in categories:
+                width = self._chip_width_cache.get(cat)
+                if width is None:
+                    width = self._chip_width_cache.setdefault(
+                        cat, max(50, self._chip_font.measure(cat) + 20)
+                    )
+                chip = ctk.CTkButton(
+                    self._chips_scroll,
+                    text=cat,
+                    height=30,
+                    width=width,
+                    fg_color=AppTheme.BTN_SECONDARY_BG,
+                    text_color=AppTheme.FG_MUTED,
+                    hover_color=AppTheme.BTN_PRIMARY_HOVER,
+                    font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM),
+                    corner_radius=12,
+                    command=lambda c=cat: self._select_category(c),
+                )
+                chip.pack(side="left", padx=(0, 4))
+                self._chip_widgets[cat] = chip
+            self._last_active_chip = object()  # force a retint pass
+        elif self._active_category == self._last_active_chip:
+            return  # same chips, same highlight – nothing to do
+
+        self._last_active_chip = self._active_category
+        for cat, chip in self._chip_widgets.items():
             is_active = (
                 cat == _ALL_CHIP and self._active_category is None
             ) or cat == self._active_category
-
-            chip = ctk.CTkButton(
-                self._chips_scroll,
-                text=cat,
-                height=30,
-                width=max(50, len(cat) * 9),
+            chip.configure(
                 fg_color=AppTheme.BTN_PRIMARY_BG if is_active else AppTheme.BTN_SECONDARY_BG,
                 text_color=AppTheme.BTN_PRIMARY_FG if is_active else AppTheme.FG_MUTED,
-                hover_color=AppTheme.BTN_PRIMARY_HOVER,
                 font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM, "bold" if is_active else "normal"),
-                corner_radius=12,
-                command=lambda c=cat: self._select_category(c),
             )
-            chip.pack(side="left", padx=(0, 4))
 
     def _select_category(self, cat: str) -> None:
         self._active_category = None if cat == _ALL_CHIP else cat
@@ -220,55 +302,144 @@ class LibraryPanel(ctk.CTkFrame):
     # List rendering
     # ------------------------------------------------------------------
 
+    def _schedule_refresh(self, delay_ms: int = 175) -> None:
+        """Coalesce a typing burst into a single card rebuild."""
+        if self._search_after_job:
+            self.after_cancel(self._search_after_job)
+        self._search_after_job = self.after(delay_ms, self._refresh_list)
+
     def _refresh_list(self, _state: Optional[LibraryState] = None) -> None:
-        # Clear old cards
-        for widget in self._scroll.winfo_children():
-            widget.destroy()
-        self._cards.clear()
+        self._search_after_job = None
+        if self._build_after_id:  # a stale chunked build is superseded
+            self.after_cancel(self._build_after_id)
+            self._build_after_id = None
 
         query = self._search_var.get().strip()
-        filtered = self._svc.search(query)
-
-        # Category filter
-        if self._active_category:
-            filtered = [p for p in filtered if p.category == self._active_category]
+        category = self._active_category
+        # No filters: skip the search call entirely. Otherwise one service
+        # call applies the cheap category test before the haystack scan;
+        # keystrokes extending the previous query (same category) rescan
+        # only its result set.
+        if not query and category is None:
+            filtered = self._svc.get_all()
+            self._last_query, self._last_result = "", []
+        else:
+            if (
+                self._last_query
+                and query.startswith(self._last_query)
+                and category == self._last_category
+            ):
+                filtered = self._svc.search(query, within=self._last_result)
+            else:
+                filtered = self._svc.search(query, category=category)
+            self._last_query, self._last_result = query, filtered
+            self._last_category = category
 
         ranked = self._svc.ranked(filtered)
-        self._refresh_chips(ranked)
+        self._refresh_chips()
+
+        # Reset the virtualization window when the filter context changes
+        sig = (query, category)
+        if sig != self._window_sig:
+            self._window_sig = sig
+            self._render_limit = _RENDER_CHUNK
+        self._ranked_count = len(ranked)
+        visible = ranked if len(ranked) <= self._render_limit else ranked[: self._render_limit]
+
+        # Detach the viewport while mutating cards: Tk then performs one
+        # layout/scrollregion pass on re-attach instead of one per change
+        self._scroll.pack_forget()
+
+        # Park cards whose prompt dropped out of the rendered window
+        wanted = {p.id for p in visible}
+        for pid in [pid for pid in self._cards if pid not in wanted]:
+            card = self._cards.pop(pid)
+            card.pack_forget()
+            if len(self._card_pool) < _CARD_POOL_MAX:
+                self._card_pool.append(card)
+            else:
+                card.destroy()
 
         if not ranked:
-            ctk.CTkLabel(
+            self._show_empty_label()
+            self._reattach_scroll()
+            self._update_stats(0)
+            return
+        self._hide_empty_label()
+
+        # Rebind surviving/pooled cards, creating widgets only for growth,
+        # then repack in ranked order (pack order defines display order).
+        # Fresh constructions are chunked across event-loop turns.
+        self._sync_list = visible
+        self._sync_pos = 0
+        self._continue_sync(initial=True)
+        self._update_stats(len(ranked))
+
+    def _continue_sync(self, initial: bool = False) -> None:
+        self._build_after_id = None
+        built = 0
+        items = self._sync_list
+        while self._sync_pos < len(items):
+            prompt = items[self._sync_pos]
+            card = self._cards.get(prompt.id)
+            if card is not None:
+                card.update_from(prompt)
+                card.pack_forget()
+            elif self._card_pool:
+                card = self._card_pool.pop()
+                card.update_from(prompt)
+                self._cards[prompt.id] = card
+            else:
+                if built >= _BUILD_BATCH:
+                    # Yield to the mainloop before building more cards
+                    self._build_after_id = self.after(0, self._continue_sync)
+                    break
+                card = PromptCard(
+                    self._scroll,
+                    prompt=prompt,
+                    on_copy=self._handle_copy,
+                    on_delete=self._handle_delete,
+                    on_edit=self._handle_edit,
+                    on_favourite=self._handle_favourite,
+                    on_role_change=self._handle_role_change,
+                    on_inline_edit=self._handle_inline_edit,
+                )
+                self._cards[prompt.id] = card
+                built += 1
+            card.pack(fill="x", padx=8, pady=3)
+            self._sync_pos += 1
+        if initial:
+            # Paint what we have; later batches pack into the live view
+            self._reattach_scroll()
+
+    def _extend_render_window(self) -> None:
+        """Materialize the next chunk of cards as the user scrolls down."""
+        self._render_limit += _RENDER_CHUNK
+        self._refresh_list()
+
+    def _reattach_scroll(self) -> None:
+        # before= keeps the viewport above the stats footer
+        self._scroll.pack(fill="both", expand=True, padx=0, pady=0, before=self._stats_lbl)
+
+    def _show_empty_label(self) -> None:
+        if self._empty_lbl is None:
+            self._empty_lbl = ctk.CTkLabel(
                 self._scroll,
                 text="No prompts yet.\nClick ＋ New to create one.",
                 text_color=AppTheme.FG_MUTED,
                 font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_MD),
                 justify="center",
-            ).pack(pady=48)
-            self._update_stats(ranked)
-            return
-
-        for prompt in ranked:
-            card = PromptCard(
-                self._scroll,
-                prompt=prompt,
-                on_copy=self._handle_copy,
-                on_delete=self._handle_delete,
-                on_edit=self._handle_edit,
-                on_favourite=self._handle_favourite,
-                on_role_change=self._handle_role_change,
-                on_inline_edit=self._handle_inline_edit,
             )
-            card.pack(fill="x", padx=8, pady=3)
-            self._cards.append(card)
+        self._empty_lbl.pack(pady=48)
 
-        self._update_stats(ranked)
+    def _hide_empty_label(self) -> None:
+        if self._empty_lbl is not None:
+            self._empty_lbl.pack_forget()
 
-    def _update_stats(self, prompts: List[Prompt]) -> None:
-        total = len(self._svc.get_all())
-        shown = len(prompts)
-        total_uses = sum(p.usage_count for p in self._svc.get_all())
+    def _update_stats(self, shown: int) -> None:
+        self._last_shown_count = shown
         self._stats_lbl.configure(
-            text=f" {shown}/{total} prompts  •  {total_uses} total uses"
+            text=f" {shown}/{self._total} prompts  •  {self._total_uses} total uses"
         )
 
     # ------------------------------------------------------------------
@@ -280,7 +451,7 @@ class LibraryPanel(ctk.CTkFrame):
             self._svc.increment_usage(prompt.id)
             self._toast(f"Copied: {prompt.name}")
 
-    def _handle_delete(self, prompt_id: str) -> None:
+    def _handle_delete(self, prompt_id: int) -> None:
         if messagebox.askyesno("Delete Prompt", "Delete this prompt permanently?", parent=self):
             self._svc.delete(prompt_id)
 
@@ -297,13 +468,13 @@ class LibraryPanel(ctk.CTkFrame):
                 category=result["category"],
             )
 
-    def _handle_favourite(self, prompt_id: str) -> None:
+    def _handle_favourite(self, prompt_id: int) -> None:
         self._svc.toggle_favorite(prompt_id)
 
-    def _handle_role_change(self, prompt_id: str, role: PromptRole) -> None:
+    def _handle_role_change(self, prompt_id: int, role: PromptRole) -> None:
         self._svc.update(prompt_id, role=role.value)
 
-    def _handle_inline_edit(self, prompt_id: str, field: str, new_value: str) -> None:
+    def _handle_inline_edit(self, prompt_id: int, field: str, new_value: str) -> None:
         """Commit an inline edit from a PromptCard without reopening a dialog."""
         self._svc.update(prompt_id, **{field: new_value})
         self._toast(f"Updated {field}")
@@ -329,9 +500,8 @@ class LibraryPanel(ctk.CTkFrame):
         )
         if path:
             try:
-                json_str = self._storage.export_json(self._svc.state)
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(json_str)
+                with open(path, "wb") as f:
+                    self._storage.export_json_to(self._svc.state, f)
                 self._toast(f"Exported to {path}")
             except Exception as exc:  # noqa: BLE001
                 messagebox.showerror("Export Failed", str(exc), parent=self)
@@ -344,32 +514,79 @@ class LibraryPanel(ctk.CTkFrame):
         )
         if not path:
             return
-        try:
-            with open(path, encoding="utf-8") as f:
-                raw = f.read()
-            new_state = self._storage.import_json(raw)
-            merge = messagebox.askyesno(
-                "Import Mode",
-                "Merge with existing prompts?\n\n"
-                "Yes = merge (keep both, skip duplicate IDs)\n"
-                "No  = replace all existing prompts",
-                parent=self,
-            )
-            self._svc.import_state(new_state, merge=merge)
-            self._toast("Import complete")
-        except Exception as exc:  # noqa: BLE001
-            messagebox.showerror("Import Failed", str(exc), parent=self)
+        merge = messagebox.askyesno(
+            "Import Mode",
+            "Merge with existing prompts?\n\n"
+            "Yes = merge (keep both, skip duplicate IDs)\n"
+            "No  = replace all existing prompts",
+            parent=self,
+        )
+
+        # Read + parse on a worker thread – large libraries would
+        # otherwise freeze the window for the whole decode – and marshal
+        # the state mutation back to the UI thread.
+        def worker() -> None:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    raw = f.read()
+                new_state = self._storage.import_json(raw)
+            except Exception as exc:  # noqa: BLE001
+                # Bind the message now – `exc` is unbound once the except
+                # block exits, before the deferred callback runs
+                msg = str(exc)
+                self.after(0, lambda m=msg: messagebox.showerror("Import Failed", m, parent=self))
+                return
+            self.after(0, self._finish_import, new_state, merge)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _finish_import(self, new_state: LibraryState, merge: bool) -> None:
+        self._svc.import_state(new_state, merge=merge)
+        self._toast("Import complete")
 
     # ------------------------------------------------------------------
     # Observer
     # ------------------------------------------------------------------
 
+    def _recompute_state_caches(self, state: LibraryState) -> None:
+        """Refresh per-mutation aggregates so per-keystroke refreshes read
+        them in O(1) instead of rescanning every prompt."""
+        prompts = state.prompts
+        self._category_set = {p.category for p in prompts if p.category}
+        self._sorted_categories = sorted(self._category_set)
+        self._total = len(prompts)
+        self._total_uses = sum(p.usage_count for p in prompts)
+
     def _on_state_changed(self, state: LibraryState) -> None:
-        # If active category no longer exists in prompts, reset to All
-        if self._active_category:
-            categories = {p.category for p in state.prompts}
-            if self._active_category not in categories:
-                self._active_category = None
+        # Bulk operations can notify once per prompt; stash the newest
+        # state and fold the burst into one idle-time refresh
+        self._latest_state = state
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._flush_state_change)
+
+    def _flush_state_change(self) -> None:
+        self._refresh_pending = False
+        state = self._latest_state
+        if state is None:
+            return
+        self._recompute_state_caches(state)
+        # Library contents changed – the narrowing cache is stale
+        self._last_query, self._last_result = "", []
+
+        # Usage-count-only mutations leave the rendered card set intact;
+        # refresh just the stats line and skip the O(N) resync
+        signature = tuple(
+            (p.id, p.name, p.category, p.role, p.is_favorite) for p in state.prompts
+        )
+        if signature == self._last_signature:
+            self._update_stats(self._last_shown_count)
+            return
+        self._last_signature = signature
+        # If active category no longer exists in prompts, reset to All –
+        # one lookup in the set maintained by _recompute_state_caches
+        if self._active_category and self._active_category not in self._category_set:
+            self._active_category = None
         self._refresh_list(state)
         if self._on_selection_changed:
             self._on_selection_changed(state.prompts)
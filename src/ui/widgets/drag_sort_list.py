@@ -9,6 +9,7 @@ check-state change. Does NOT know about persistence.
 
 from __future__ import annotations
 
+import bisect
 import tkinter as tk
 from typing import Callable, Dict, List, Optional, Tuple
 import customtkinter as ctk
@@ -17,7 +18,7 @@ from models.prompt import Prompt
 from ui.app_theme import AppTheme
 
 OnCheckChange = Callable[[], None]
-OnReorder = Callable[[List[str]], None]      # ordered list of prompt ids
+OnReorder = Callable[[List[int]], None]      # ordered list of prompt ids
 OnCopySingle = Callable[[Prompt], None]
 
 
@@ -61,6 +62,17 @@ class _ItemRow(ctk.CTkFrame):
     # Build
     # ------------------------------------------------------------------
 
+    def update_from(self, prompt: Prompt, var: ctk.BooleanVar) -> None:
+        """Rebind this row to another prompt in place.
+
+        Reconfiguring the existing checkbox/label is far cheaper than
+        constructing a fresh row (CTk widget creation is canvas-bound).
+        """
+        self.prompt = prompt
+        self.var = var
+        self._check.configure(variable=var)
+        self._name_lbl.configure(text=prompt.name)
+
     def _build(self, role_color: str) -> None:
         # Drag handle
         handle = ctk.CTkLabel(
@@ -79,7 +91,7 @@ class _ItemRow(ctk.CTkFrame):
         handle.bind("<ButtonRelease-1>", self._on_release)
 
         # Checkbox
-        ctk.CTkCheckBox(
+        self._check = ctk.CTkCheckBox(
             self,
             text="",
             variable=self.var,
@@ -89,17 +101,18 @@ class _ItemRow(ctk.CTkFrame):
             border_color=AppTheme.BORDER,
             hover_color=AppTheme.BTN_PRIMARY_HOVER,
             command=self._on_check_change,
-        ).pack(side="left", padx=(0, 4))
+        )
+        self._check.pack(side="left", padx=(0, 4))
 
         # Name label (full width)
-        name_lbl = ctk.CTkLabel(
+        self._name_lbl = ctk.CTkLabel(
             self,
             text=self.prompt.name,
             font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_MD),
             text_color=role_color,
             anchor="w",
         )
-        name_lbl.pack(side="left", fill="x", expand=True, padx=(0, 4))
+        self._name_lbl.pack(side="left", fill="x", expand=True, padx=(0, 4))
 
         # Quick-copy button
         ctk.CTkButton(
@@ -111,9 +124,15 @@ class _ItemRow(ctk.CTkFrame):
             hover_color=AppTheme.BG_HOVER,
             font=(AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_SM),
             corner_radius=4,
-            command=lambda: self._on_copy(self.prompt),
+            command=self._handle_copy,
         ).pack(side="right", padx=4, pady=4)
 
+    def _handle_copy(self) -> None:
+        # Bound method instead of a per-row closure: reads self.prompt at
+        # click time, so it stays correct when the row is rebound via
+        # update_from.
+        self._on_copy(self.prompt)
+
     # ------------------------------------------------------------------
     # Drag events – delegate to parent
     # ------------------------------------------------------------------
@@ -170,13 +189,19 @@ class DragSortableList(ctk.CTkFrame):
 
         # State
         self._items: List[Prompt] = []               # ordered
-        self._vars: Dict[str, ctk.BooleanVar] = {}   # keyed by prompt.id
+        self._vars: Dict[int, ctk.BooleanVar] = {}   # keyed by prompt.id
         self._rows: List[_ItemRow] = []              # ordered, matching _items
+        self._row_pool: List[_ItemRow] = []          # unpacked rows kept for reuse
+        self._placeholder: Optional[ctk.CTkLabel] = None
 
         # Drag state
         self._drag_row: Optional[_ItemRow] = None
         self._drag_start_y: int = 0
         self._drag_source_index: int = -1
+        self._row_mids: List[int] = []   # row midpoints, captured at drag start
+        self._motion_pending = False     # throttle flag for <B1-Motion> bursts
+        self._last_motion_y = 0
+        self._last_drop_idx: Optional[int] = None  # the one highlighted row
 
         _, self._role_color = AppTheme.role_badge(role)
 
@@ -198,6 +223,17 @@ class DragSortableList(ctk.CTkFrame):
         self._items = list(prompts)
         self._render()
 
+    def sync_items(self, prompts: List[Prompt]) -> None:
+        """Refresh backing prompt objects without touching any widgets.
+
+        For state changes that alter no displayed text (usage bumps,
+        content-only edits) the rows keep their geometry; only the data
+        references move so copy/compose read fresh content.
+        """
+        self._items = list(prompts)
+        for row, prompt in zip(self._rows, prompts):
+            row.prompt = prompt
+
     def clear_all(self) -> None:
         """Uncheck all items."""
         for var in self._vars.values():
@@ -205,49 +241,79 @@ class DragSortableList(ctk.CTkFrame):
         self._on_change()
 
     def get_checked_in_order(self) -> List[Prompt]:
-        """Return checked prompts in their current display order."""
-        return [p for p in self._items if self._vars.get(p.id, ctk.BooleanVar()).get()]
+        """Return checked prompts in their current display order.
+
+        Missing ids mean unchecked – never allocate a default BooleanVar
+        here, as each one leaks a Tcl-side variable.
+        """
+        return [p for p in self._items if (v := self._vars.get(p.id)) is not None and v.get()]
 
     # ------------------------------------------------------------------
     # Render
     # ------------------------------------------------------------------
 
     def _render(self) -> None:
-        for row in self._rows:
-            row.destroy()
-        self._rows.clear()
-
+        """Sync rows to items, reusing existing row widgets in place."""
         if not self._items:
+            for row in self._rows:
+                row.pack_forget()
+            self._row_pool.extend(self._rows)
+            self._rows.clear()
+            self._show_placeholder()
+            return
+
+        self._hide_placeholder()
+
+        # Shrink: park surplus rows in the pool instead of destroying them
+        while len(self._rows) > len(self._items):
+            row = self._rows.pop()
+            row.pack_forget()
+            self._row_pool.append(row)
+
+        for i, prompt in enumerate(self._items):
+            if i < len(self._rows):
+                self._rows[i].update_from(prompt, self._vars[prompt.id])
+            elif self._row_pool:
+                row = self._row_pool.pop()
+                row.update_from(prompt, self._vars[prompt.id])
+                row.pack(fill="x", pady=2)
+                self._rows.append(row)
+            else:
+                row = _ItemRow(
+                    self,
+                    prompt=prompt,
+                    var=self._vars[prompt.id],
+                    on_check_change=self._on_change,
+                    on_copy=self._on_copy,
+                    on_drag_start=self._on_drag_start,
+                    on_drag_motion=self._on_drag_motion,
+                    on_drag_release=self._on_drag_release,
+                    role_color=self._role_color,
+                )
+                row.pack(fill="x", pady=2)
+                self._rows.append(row)
+
+        # One deferred idle pass lets Tk (and the scrollable frame's
+        # scrollregion recompute) coalesce the whole batch of pack calls
+        # into a single relayout instead of one per row.
+        self.after_idle(self.update_idletasks)
+
+    def _show_placeholder(self) -> None:
+        if self._placeholder is None:
             role_cap = self._role.capitalize()
-            ctk.CTkLabel(
+            self._placeholder = ctk.CTkLabel(
                 self,
                 text=f"No {self._role} prompts yet.\n"
                      f"Create one with role = {role_cap}.",
                 text_color=AppTheme.FG_MUTED,
                 font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM),
                 justify="left",
-            ).pack(anchor="w", padx=4, pady=4)
-            return
-
-        # Remove placeholder label if present
-        for w in self.winfo_children():
-            if isinstance(w, ctk.CTkLabel):
-                w.destroy()
-
-        for prompt in self._items:
-            row = _ItemRow(
-                self,
-                prompt=prompt,
-                var=self._vars[prompt.id],
-                on_check_change=self._on_change,
-                on_copy=self._on_copy,
-                on_drag_start=self._on_drag_start,
-                on_drag_motion=self._on_drag_motion,
-                on_drag_release=self._on_drag_release,
-                role_color=self._role_color,
             )
-            row.pack(fill="x", pady=2)
-            self._rows.append(row)
+        self._placeholder.pack(anchor="w", padx=4, pady=4)
+
+    def _hide_placeholder(self) -> None:
+        if self._placeholder is not None:
+            self._placeholder.pack_forget()
 
     # ------------------------------------------------------------------
     # Drag & Drop
@@ -261,20 +327,36 @@ class DragSortableList(ctk.CTkFrame):
         except ValueError:
             self._drag_row = None
             return
+        # Capture row midpoints once per drag: winfo_* calls round-trip to
+        # the X server, so they must not run per <B1-Motion> event
+        self.update_idletasks()
+        self._row_mids = [r.winfo_rooty() + r.winfo_height() // 2 for r in self._rows]
         row.set_drag_highlight(True)
 
     def _on_drag_motion(self, y_root: int) -> None:
-        if self._drag_row is None:
+        # <B1-Motion> fires per pixel; coalesce to ~one update per frame
+        self._last_motion_y = y_root
+        if self._motion_pending or self._drag_row is None:
             return
+        self._motion_pending = True
+        self.after(16, self._do_drag_motion)
 
-        target_index = self._find_drop_target(y_root)
-        if target_index is None or target_index == self._drag_source_index:
-            self._clear_drop_highlights()
+    def _do_drag_motion(self) -> None:
+        self._motion_pending = False
+        if self._drag_row is None:
             return
 
-        self._clear_drop_highlights()
-        if 0 <= target_index < len(self._rows):
+        target_index = self._find_drop_target(self._last_motion_y)
+        if target_index == self._drag_source_index:
+            target_index = None
+        if target_index == self._last_drop_idx:
+            return  # highlight already correct
+
+        # Unhighlight only the previously marked row – O(1) per move
+        self._unhighlight_last_drop()
+        if target_index is not None and 0 <= target_index < len(self._rows):
             self._rows[target_index].set_drop_target_highlight(True)
+            self._last_drop_idx = target_index
 
     def _on_drag_release(self) -> None:
         if self._drag_row is None:
@@ -289,7 +371,7 @@ class DragSortableList(ctk.CTkFrame):
         target_index = self._find_drop_target(y_root)
         source_index = self._drag_source_index
 
-        self._clear_drop_highlights()
+        self._unhighlight_last_drop()
         self._drag_row.set_drag_highlight(False)
         self._drag_row = None
         self._drag_source_index = -1
@@ -298,34 +380,43 @@ class DragSortableList(ctk.CTkFrame):
             self._swap_items(source_index, target_index)
 
     def _find_drop_target(self, y_root: int) -> Optional[int]:
-        """Return which row index is closest to y_root."""
-        if not self._rows:
+        """Return which row index is closest to y_root (bisect over the
+        midpoints captured at drag start)."""
+        mids = self._row_mids
+        if not mids:
             return None
-        best_index = 0
-        best_dist = float("inf")
-        for i, row in enumerate(self._rows):
-            try:
-                row_y = row.winfo_rooty() + row.winfo_height() // 2
-                dist = abs(y_root - row_y)
-                if dist < best_dist:
-                    best_dist = dist
-                    best_index = i
-            except Exception:
-                continue
-        return best_index
+        i = bisect.bisect_left(mids, y_root)
+        if i <= 0:
+            return 0
+        if i >= len(mids):
+            return len(mids) - 1
+        # Pick whichever neighbouring midpoint is nearer
+        return i if (mids[i] - y_root) < (y_root - mids[i - 1]) else i - 1
 
     def _swap_items(self, from_idx: int, to_idx: int) -> None:
-        """Reorder items list and re-render."""
+        """Reorder items and move just the dragged row widget."""
         if not (0 <= from_idx < len(self._items)) or not (0 <= to_idx < len(self._items)):
             return
         # Move item from_idx to position to_idx
         item = self._items.pop(from_idx)
         self._items.insert(to_idx, item)
-        self._render()
+        self._row_mids = []  # stale once rows move
+
+        # O(1) widget mutation: repack the one moved row in front of its
+        # new successor instead of re-rendering every row
+        row = self._rows.pop(from_idx)
+        self._rows.insert(to_idx, row)
+        row.pack_forget()
+        if to_idx + 1 < len(self._rows):
+            row.pack(fill="x", pady=2, before=self._rows[to_idx + 1])
+        else:
+            row.pack(fill="x", pady=2)
+
         if self._on_reorder:
             self._on_reorder([p.id for p in self._items])
         self._on_change()
 
-    def _clear_drop_highlights(self) -> None:
-        for row in self._rows:
-            row.set_drop_target_highlight(False)
+    def _unhighlight_last_drop(self) -> None:
+        if self._last_drop_idx is not None and self._last_drop_idx < len(self._rows):
+            self._rows[self._last_drop_idx].set_drop_target_highlight(False)
+        self._last_drop_idx = None
@@ -5,28 +5,266 @@ Responsibility: render one prompt with its metadata and action buttons.
 v1.1: Supports inline editing of name and content (double-click to edit,
       Enter / Ctrl+Enter / focus-out to commit). Fires callbacks for all
       mutations; does NOT persist directly.
+
+Construction is on-demand by design: the library panel only builds cards
+inside its virtualized render window, so prompts that are never scrolled
+to never pay a construction cost at all.
+
+PERFORMANCE NOTES – the card hot path is bound by Tk widget count
+(canvas allocations, geometry passes), not Python bytecode; compiling or
+micro-optimizing this code will not help, only these rules do:
+  1. Widget budget per card: labels + one meta frame, zero CTkButtons –
+     actions live on the shared _CardToolbar, edits borrow the shared
+     content editor.
+  2. pack/grid each widget exactly once per build; never force layout
+     (update()/winfo_*) inside _build.
+  3. Fonts and badge colours come from the module-level constants, never
+     inline tuples.
+  4. All mutations go through update_from()/configure() – never
+     destroy()+recreate a card for a data change.
 """
 
 from __future__ import annotations
 
+import tkinter as tk
+from functools import lru_cache
 from typing import Callable, Optional
 import customtkinter as ctk
 
 from models.prompt import Prompt, PromptRole
 from ui.app_theme import AppTheme
 
+# Font tuples + role badge colours resolved once at import – each inline
+# tuple otherwise re-runs AppTheme attribute lookups (and a fresh Tk font
+# intern) per card construction.
+_FONT_STAR = (AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_LG)
+_FONT_NAME = (AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_MD, "bold")
+_FONT_MONO_SM = (AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_SM)
+_FONT_MONO_SM_BOLD = (AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_SM, "bold")
+_FONT_UI_SM = (AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM)
+_FONT_UI_XS = (AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_XS)
+_ROLE_BADGE_CACHE = {r.value: AppTheme.role_badge(r.value) for r in PromptRole}
+
+
+# One C-level pass normalizes all line-break/tab whitespace for previews
+_PREVIEW_XLAT = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+_PREVIEW_LIMIT = 80
+
+
+@lru_cache(maxsize=1024)
+def _make_preview(content: str) -> str:
+    """Derive the 80-char single-line preview for a card.
+
+    Cached at module level (Prompt is a slotted, occasionally in-place
+    mutated dataclass, so cached_property is out): filter/sort rebuilds
+    recompute previews for unchanged content constantly.
+    """
+    if len(content) <= _PREVIEW_LIMIT:
+        # Typical short prompts: no slice copy at all
+        return content.translate(_PREVIEW_XLAT)
+    return content[:_PREVIEW_LIMIT].translate(_PREVIEW_XLAT) + "…"
+
+# Hover restyling is dispatched through two Tk bind-class tags installed
+# once per process: thousands of per-label lambda closures collapse into
+# four module-level handlers that recover the card from the widget.
+_CLASS_BINDINGS_READY = False
+
+
+def _init_class_bindings(widget) -> None:
+    global _CLASS_BINDINGS_READY
+    if _CLASS_BINDINGS_READY:
+        return
+    _CLASS_BINDINGS_READY = True
+    widget.bind_class("PromptCardName", "<Enter>", _on_name_enter)
+    widget.bind_class("PromptCardName", "<Leave>", _on_name_leave)
+    widget.bind_class("PromptCardName", "<Double-Button-1>", _on_name_double)
+    widget.bind_class("PromptCardContent", "<Enter>", _on_content_enter)
+    widget.bind_class("PromptCardContent", "<Leave>", _on_content_leave)
+    widget.bind_class("PromptCardContent", "<Double-Button-1>", _on_content_double)
+
+
+def _attach_bind_tag(parts, tag: str, card: "PromptCard") -> None:
+    for w in parts:
+        w.card_ref = card
+        tags = w.bindtags()
+        if tag not in tags:
+            w.bindtags((tag,) + tags)
+
+
+def _fast_set_fg(lbl: ctk.CTkLabel, color: str) -> None:
+    """Swap a CTkLabel's text colour via its inner tk Label.
+
+    configure(text_color=...) runs CTk's full _draw pipeline (a canvas
+    redraw) even though only the foreground changes; poking the inner
+    label is enough for hover swaps and keeps mouse motion over long
+    lists smooth. Falls back to the normal path if the internals move.
+    """
+    try:
+        lbl._label.configure(fg=color)
+    except (AttributeError, tk.TclError):
+        lbl.configure(text_color=color)
+
+
+def _on_name_enter(event) -> None:
+    card = getattr(event.widget, "card_ref", None)
+    if card is not None and not card._name_editing:
+        _fast_set_fg(card._name_lbl, AppTheme.FG_ACCENT)
+
+
+def _on_name_leave(event) -> None:
+    card = getattr(event.widget, "card_ref", None)
+    if card is not None and not card._name_editing:
+        _fast_set_fg(card._name_lbl, AppTheme.FG_MAIN)
+
+
+def _on_name_double(event) -> None:
+    card = getattr(event.widget, "card_ref", None)
+    if card is not None:
+        card._start_name_edit()
+
+
+def _on_content_double(event) -> None:
+    card = getattr(event.widget, "card_ref", None)
+    if card is not None:
+        card._start_content_edit()
+
+
+def _on_content_enter(event) -> None:
+    card = getattr(event.widget, "card_ref", None)
+    if card is not None and not card._content_editing:
+        _fast_set_fg(card._content_lbl, AppTheme.FG_MAIN)
+
+
+def _on_content_leave(event) -> None:
+    card = getattr(event.widget, "card_ref", None)
+    if card is not None and not card._content_editing:
+        _fast_set_fg(card._content_lbl, AppTheme.FG_MUTED)
+
+
 # Callback type aliases for clarity
 OnCopy        = Callable[[Prompt], None]
-OnDelete      = Callable[[str], None]
+OnDelete      = Callable[[int], None]
 OnEdit        = Callable[[Prompt], None]
-OnFavourite   = Callable[[str], None]
-OnRoleChange  = Callable[[str, PromptRole], None]
-OnInlineEdit  = Callable[[str, str, str], None]   # (prompt_id, field, new_value)
+OnFavourite   = Callable[[int], None]
+OnRoleChange  = Callable[[int, PromptRole], None]
+OnInlineEdit  = Callable[[int, str, str], None]   # (prompt_id, field, new_value)
+
+
+class _CardToolbar(ctk.CTkFrame):
+    """Floating Copy/Edit/Delete toolbar shared by every card in a list.
+
+    CTkButton is the most expensive widget on a card (canvas, hover state
+    machine, rounded corners); one toolbar that follows the hovered card
+    replaces 3×N per-card buttons.
+    """
+
+    _HIDE_DELAY_MS = 150
+
+    def __init__(self, master) -> None:
+        super().__init__(master, fg_color=AppTheme.BG_CARD, corner_radius=AppTheme.BTN_CORNER)
+        self._card: Optional["PromptCard"] = None
+        self._hide_job: Optional[str] = None
+
+        ctk.CTkButton(
+            self, text="📋 Copy", width=84, height=32,
+            fg_color=AppTheme.BTN_COPY_BG, text_color=AppTheme.BTN_COPY_FG,
+            hover_color=AppTheme.BG_HOVER,
+            font=_FONT_UI_SM,
+            corner_radius=AppTheme.BTN_CORNER,
+            command=self._dispatch_copy,
+        ).pack(side="left", padx=(0, 4))
+
+        ctk.CTkButton(
+            self, text="✏ Full Edit", width=92, height=32,
+            fg_color=AppTheme.BTN_SECONDARY_BG, text_color=AppTheme.FG_MUTED,
+            hover_color=AppTheme.BG_HOVER,
+            font=_FONT_UI_SM,
+            corner_radius=AppTheme.BTN_CORNER,
+            command=self._dispatch_edit,
+        ).pack(side="left", padx=(0, 4))
+
+        ctk.CTkButton(
+            self, text="🗑", width=38, height=32,
+            fg_color=AppTheme.BTN_DANGER_BG, text_color=AppTheme.FG_WARN,
+            hover_color="#4a1a1a",
+            font=_FONT_UI_SM,
+            corner_radius=AppTheme.BTN_CORNER,
+            command=self._dispatch_delete,
+        ).pack(side="left")
+
+        # Hovering the toolbar itself must not count as leaving the card
+        self.bind("<Enter>", lambda _e: self._cancel_hide())
+        self.bind("<Leave>", lambda _e: self.schedule_hide())
+
+    # -- attach/detach -------------------------------------------------
+
+    def attach(self, card: "PromptCard") -> None:
+        self._cancel_hide()
+        self._card = card
+        self.place(in_=card, relx=1.0, rely=0.0, x=-8, y=8, anchor="ne")
+        self.lift()
+
+    def schedule_hide(self) -> None:
+        self._cancel_hide()
+        self._hide_job = self.after(self._HIDE_DELAY_MS, self._hide)
+
+    def _cancel_hide(self) -> None:
+        if self._hide_job:
+            self.after_cancel(self._hide_job)
+            self._hide_job = None
+
+    def _hide(self) -> None:
+        self._hide_job = None
+        self._card = None
+        self.place_forget()
+
+    # -- dispatch to the hovered card ----------------------------------
+
+    def _dispatch_copy(self) -> None:
+        if self._card is not None:
+            self._card._handle_copy()
+
+    def _dispatch_edit(self) -> None:
+        if self._card is not None:
+            self._card._handle_edit()
+
+    def _dispatch_delete(self) -> None:
+        card = self._card
+        if card is not None:
+            self._hide()  # the card may be destroyed by the delete
+            card._handle_delete()
 
 
 class PromptCard(ctk.CTkFrame):
     """One prompt card shown in the library list. v1.1 supports inline editing."""
 
+    # CTkFrame still carries a __dict__, so these don't shrink the
+    # instance – but slot descriptors resolve at C level, which beats a
+    # dict lookup on every access across hundreds of cards.
+    __slots__ = (
+        "_prompt",
+        "_on_copy", "_on_delete", "_on_edit",
+        "_on_favourite", "_on_role_change", "_on_inline_edit",
+        "_name_editing", "_content_editing",
+        "_name_lbl", "_name_entry",
+        "_content_lbl", "_content_entry", "_content_hint",
+        "_shown_name", "_shown_count", "_shown_fav",
+        "_shown_category", "_shown_role", "_shown_content",
+        "_star_lbl", "_count_lbl", "_category_lbl", "_role_lbl",
+    )
+
+    # One shared toolbar per list container (keyed by master widget)
+    _toolbars: dict = {}
+
+    # One shared content-edit textbox (+hint) per list container; the
+    # embedded tk Text machinery is far too heavy to build per edit
+    _content_editors: dict = {}
+    _active_content_card: Optional["PromptCard"] = None
+
+    # Same pattern for the inline name editor
+    _name_editors: dict = {}
+    _active_name_card: Optional["PromptCard"] = None
+
     def __init__(
         self,
         master,
@@ -71,126 +309,154 @@ class PromptCard(ctk.CTkFrame):
     # ------------------------------------------------------------------
 
     def _build(self) -> None:
+        # Geometry batching contract: cards are constructed unmapped and
+        # the panel detaches its viewport while packing them, so every
+        # pack/grid below collapses into one idle-time layout pass. Keep
+        # update()/update_idletasks()/winfo_* calls out of this method –
+        # any of them would force an early synchronous relayout per card.
         p = self._prompt
-        role_bg, role_fg = AppTheme.role_badge(p.role.value)
+        role_bg, role_fg = _ROLE_BADGE_CACHE[p.role.value]
         pad = AppTheme.CARD_PAD
 
-        # --- Header row ---
-        header = ctk.CTkFrame(self, fg_color="transparent")
-        header.pack(fill="x", padx=pad, pady=(pad, 4))
-        header.columnconfigure(1, weight=1)
-
-        # Favourite star
+        # Displayed values, tracked so update_from only reconfigures
+        # widgets whose text/colour actually changed (the service mutates
+        # some prompts in place, so diffing against _prompt is not enough)
+        self._shown_name = p.name
+        self._shown_count = p.usage_count
+        self._shown_fav = p.is_favorite
+        self._shown_category = p.category
+        self._shown_role = p.role
+        self._shown_content = p.content
+
+        # Flat grid directly on the card: the former header/content
+        # wrapper frames were full CTk widgets (canvas + corner render)
+        # used purely for row grouping. Only the meta row keeps a frame –
+        # its three adjacent badges need their own packing axis.
+        self.columnconfigure(1, weight=1)
+
+        # --- Header row (row 0) ---
+        # Favourite star – a clickable label; CTkButton (frame + canvas +
+        # hover state machine) is ~3× heavier for a single glyph
         star_text = "★" if p.is_favorite else "☆"
         star_color = AppTheme.FG_GOLD if p.is_favorite else AppTheme.FG_MUTED
-        self._star_btn = ctk.CTkButton(
-            header, text=star_text, width=30, height=30,
-            fg_color="transparent", text_color=star_color,
-            hover_color=AppTheme.BG_HOVER,
-            font=(AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_LG),
-            command=self._handle_favourite,
+        self._star_lbl = ctk.CTkLabel(
+            self, text=star_text, width=30,
+            text_color=star_color,
+            font=_FONT_STAR,
+            cursor="hand2",
         )
-        self._star_btn.grid(row=0, column=0, padx=(0, 6))
+        self._star_lbl.grid(row=0, column=0, padx=(pad, 6), pady=(pad, 4))
+        self._star_lbl.bind("<Button-1>", lambda _e: self._handle_favourite())
 
         # Name label (double-click → inline edit)
         self._name_lbl = ctk.CTkLabel(
-            header,
+            self,
             text=p.name,
-            font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_MD, "bold"),
+            font=_FONT_NAME,
             text_color=AppTheme.FG_MAIN,
             anchor="w",
             cursor="xterm",
         )
-        self._name_lbl.grid(row=0, column=1, sticky="ew")
-        self._name_lbl.bind("<Double-Button-1>", lambda _: self._start_name_edit())
-        self._name_lbl.bind("<Enter>", lambda _: self._name_lbl.configure(text_color=AppTheme.FG_ACCENT) if not self._name_editing else None)
-        self._name_lbl.bind("<Leave>", lambda _: self._name_lbl.configure(text_color=AppTheme.FG_MAIN) if not self._name_editing else None)
+        self._name_lbl.grid(row=0, column=1, sticky="ew", pady=(pad, 4))
+        _init_class_bindings(self)
+        _attach_bind_tag(
+            (self._name_lbl._canvas, self._name_lbl._label), "PromptCardName", self
+        )
 
         # Usage count badge
-        ctk.CTkLabel(
-            header,
+        self._count_lbl = ctk.CTkLabel(
+            self,
             text=f"×{p.usage_count}",
-            font=(AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_SM),
+            font=_FONT_MONO_SM,
             text_color=AppTheme.FG_MUTED,
-        ).grid(row=0, column=2, padx=(6, 0))
+        )
+        self._count_lbl.grid(row=0, column=2, padx=(6, pad), pady=(pad, 4))
 
-        # --- Category + role row ---
+        # --- Category + role row (row 1) ---
         meta = ctk.CTkFrame(self, fg_color="transparent")
-        meta.pack(fill="x", padx=pad, pady=(0, 4))
+        meta.grid(row=1, column=0, columnspan=3, sticky="w", padx=pad, pady=(0, 4))
 
-        ctk.CTkLabel(
+        self._category_lbl = ctk.CTkLabel(
             meta,
             text=p.category,
-            font=(AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_SM),
+            font=_FONT_MONO_SM,
             text_color=AppTheme.FG_MUTED,
-        ).pack(side="left")
+        )
+        self._category_lbl.pack(side="left")
 
-        ctk.CTkLabel(
+        self._role_lbl = ctk.CTkLabel(
             meta,
             text=f" {p.role.value.upper()} ",
-            font=(AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_SM, "bold"),
+            font=_FONT_MONO_SM_BOLD,
             text_color=role_fg,
             fg_color=role_bg,
             corner_radius=4,
-        ).pack(side="left", padx=(6, 0))
+        )
+        self._role_lbl.pack(side="left", padx=(6, 0))
 
         ctk.CTkLabel(
             meta,
             text="  ✎ dbl-click to edit",
-            font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_XS),
+            font=_FONT_UI_XS,
             text_color="#3a3a5a",
         ).pack(side="left", padx=(8, 0))
 
-        # --- Content preview (double-click → inline edit) ---
-        self._content_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self._content_frame.pack(fill="x", padx=pad, pady=(0, 6))
-
-        preview = p.content[:80].replace("\n", " ") + ("…" if len(p.content) > 80 else "")
+        # --- Content preview (row 2; double-click → inline edit) ---
+        preview = _make_preview(p.content)
         self._content_lbl = ctk.CTkLabel(
-            self._content_frame,
+            self,
             text=preview,
-            font=(AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_SM),
+            font=_FONT_MONO_SM,
             text_color=AppTheme.FG_MUTED,
             anchor="w",
             wraplength=300,
             justify="left",
             cursor="xterm",
         )
-        self._content_lbl.pack(fill="x")
-        self._content_lbl.bind("<Double-Button-1>", lambda _: self._start_content_edit())
-        self._content_lbl.bind("<Enter>", lambda _: self._content_lbl.configure(text_color=AppTheme.FG_MAIN) if not self._content_editing else None)
-        self._content_lbl.bind("<Leave>", lambda _: self._content_lbl.configure(text_color=AppTheme.FG_MUTED) if not self._content_editing else None)
+        self._content_lbl.grid(row=2, column=0, columnspan=3, sticky="ew", padx=pad, pady=(0, pad))
+        _attach_bind_tag(
+            (self._content_lbl._canvas, self._content_lbl._label), "PromptCardContent", self
+        )
 
-        # --- Action buttons ---
-        actions = ctk.CTkFrame(self, fg_color="transparent")
-        actions.pack(fill="x", padx=pad, pady=(0, pad))
+        # --- Actions: shared floating toolbar, shown on hover ---
+        self.bind("<Enter>", lambda _e: self._toolbar().attach(self))
+        self.bind("<Leave>", lambda _e: self._toolbar().schedule_hide())
 
-        ctk.CTkButton(
-            actions, text="📋 Copy", width=84, height=32,
-            fg_color=AppTheme.BTN_COPY_BG, text_color=AppTheme.BTN_COPY_FG,
-            hover_color=AppTheme.BG_HOVER,
-            font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM),
-            corner_radius=AppTheme.BTN_CORNER,
-            command=self._handle_copy,
-        ).pack(side="left", padx=(0, 4))
+    # ------------------------------------------------------------------
+    # Widget recycling
+    # ------------------------------------------------------------------
 
-        ctk.CTkButton(
-            actions, text="✏ Full Edit", width=92, height=32,
-            fg_color=AppTheme.BTN_SECONDARY_BG, text_color=AppTheme.FG_MUTED,
-            hover_color=AppTheme.BG_HOVER,
-            font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM),
-            corner_radius=AppTheme.BTN_CORNER,
-            command=self._handle_edit,
-        ).pack(side="left", padx=(0, 4))
+    def update_from(self, prompt: Prompt) -> None:
+        """Rebind this card to another prompt, reconfiguring only the
+        widgets whose displayed value actually changed."""
+        self._prompt = prompt
 
-        ctk.CTkButton(
-            actions, text="🗑", width=38, height=32,
-            fg_color=AppTheme.BTN_DANGER_BG, text_color=AppTheme.FG_WARN,
-            hover_color="#4a1a1a",
-            font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_SM),
-            corner_radius=AppTheme.BTN_CORNER,
-            command=self._handle_delete,
-        ).pack(side="left")
+        if prompt.name != self._shown_name:
+            self._shown_name = prompt.name
+            if self._name_lbl:
+                self._name_lbl.configure(text=prompt.name)
+        if prompt.usage_count != self._shown_count:
+            self._shown_count = prompt.usage_count
+            self._count_lbl.configure(text=f"×{prompt.usage_count}")
+        if prompt.is_favorite != self._shown_fav:
+            self._shown_fav = prompt.is_favorite
+            self._star_lbl.configure(
+                text="★" if prompt.is_favorite else "☆",
+                text_color=AppTheme.FG_GOLD if prompt.is_favorite else AppTheme.FG_MUTED,
+            )
+        if prompt.category != self._shown_category:
+            self._shown_category = prompt.category
+            self._category_lbl.configure(text=prompt.category)
+        if prompt.role != self._shown_role:
+            self._shown_role = prompt.role
+            role_bg, role_fg = _ROLE_BADGE_CACHE[prompt.role.value]
+            self._role_lbl.configure(
+                text=f" {prompt.role.value.upper()} ", text_color=role_fg, fg_color=role_bg
+            )
+        if prompt.content != self._shown_content:
+            self._shown_content = prompt.content
+            if self._content_lbl:
+                self._content_lbl.configure(text=_make_preview(prompt.content))
 
     # ------------------------------------------------------------------
     # Inline name editing
@@ -199,36 +465,33 @@ class PromptCard(ctk.CTkFrame):
     def _start_name_edit(self) -> None:
         if self._name_editing or self._name_lbl is None:
             return
+        active = PromptCard._active_name_card
+        if active is not None and active is not self:
+            active._commit_name_edit()
+
         self._name_editing = True
+        PromptCard._active_name_card = self
         self._name_lbl.grid_remove()
 
-        self._name_entry = ctk.CTkEntry(
-            self._name_lbl.master,
-            fg_color=AppTheme.BG_INPUT,
-            border_color=AppTheme.BORDER_ACCENT,
-            border_width=1,
-            text_color=AppTheme.FG_MAIN,
-            height=32,
-            font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_MD, "bold"),
-        )
-        self._name_entry.insert(0, self._prompt.name)
-        self._name_entry.grid(row=0, column=1, sticky="ew")
-        self._name_entry.focus_set()
-        self._name_entry.select_range(0, "end")
-        self._name_entry.bind("<Return>", lambda _: self._commit_name_edit())
-        self._name_entry.bind("<Escape>", lambda _: self._cancel_name_edit())
-        self._name_entry.bind("<FocusOut>", lambda _: self._commit_name_edit())
+        entry = self._name_editor()
+        self._name_entry = entry
+        entry.delete(0, "end")
+        entry.insert(0, self._prompt.name)
+        entry.grid(in_=self, row=0, column=1, sticky="ew", pady=(AppTheme.CARD_PAD, 4))
+        entry.focus_set()
+        entry.select_range(0, "end")
 
     def _commit_name_edit(self) -> None:
         if not self._name_editing or self._name_entry is None:
             return
         new_name = self._name_entry.get().strip()
-        self._name_editing = False
-        self._name_entry.destroy()
-        self._name_entry = None
+        # Release first: parking the entry fires <FocusOut>, whose
+        # dispatcher must see no active card rather than re-entering.
+        self._release_name_editor()
         if new_name and new_name != self._prompt.name and self._on_inline_edit:
             self._on_inline_edit(self._prompt.id, "name", new_name)
             if self._name_lbl:
+                self._shown_name = new_name  # keep update_from's diff in sync
                 self._name_lbl.configure(text=new_name)
         if self._name_lbl:
             self._name_lbl.grid()
@@ -236,12 +499,48 @@ class PromptCard(ctk.CTkFrame):
     def _cancel_name_edit(self) -> None:
         if not self._name_editing or self._name_entry is None:
             return
-        self._name_editing = False
-        self._name_entry.destroy()
-        self._name_entry = None
+        self._release_name_editor()
         if self._name_lbl:
             self._name_lbl.grid()
 
+    def _release_name_editor(self) -> None:
+        """Park the shared entry again after an edit ends."""
+        self._name_editing = False
+        PromptCard._active_name_card = None
+        self._name_entry.grid_forget()
+        self._name_entry = None
+
+    def _name_editor(self) -> ctk.CTkEntry:
+        """Return (creating on first use) this list's shared name entry."""
+        entry = PromptCard._name_editors.get(self.master)
+        if entry is None:
+            entry = ctk.CTkEntry(
+                self.master,
+                fg_color=AppTheme.BG_INPUT,
+                border_color=AppTheme.BORDER_ACCENT,
+                border_width=1,
+                text_color=AppTheme.FG_MAIN,
+                height=32,
+                font=_FONT_NAME,
+            )
+            entry.bind("<Return>", PromptCard._dispatch_name_commit)
+            entry.bind("<Escape>", PromptCard._dispatch_name_cancel)
+            entry.bind("<FocusOut>", PromptCard._dispatch_name_commit)
+            PromptCard._name_editors[self.master] = entry
+        return entry
+
+    @staticmethod
+    def _dispatch_name_commit(_event: object = None) -> None:
+        card = PromptCard._active_name_card
+        if card is not None:
+            card._commit_name_edit()
+
+    @staticmethod
+    def _dispatch_name_cancel(_event: object = None) -> None:
+        card = PromptCard._active_name_card
+        if card is not None:
+            card._cancel_name_edit()
+
     # ------------------------------------------------------------------
     # Inline content editing
     # ------------------------------------------------------------------
@@ -249,64 +548,139 @@ class PromptCard(ctk.CTkFrame):
     def _start_content_edit(self) -> None:
         if self._content_editing or self._content_lbl is None:
             return
-        self._content_editing = True
-        self._content_lbl.pack_forget()
+        # Another card may still be editing through the shared textbox
+        active = PromptCard._active_content_card
+        if active is not None and active is not self:
+            active._commit_content_edit()
 
-        self._content_entry = ctk.CTkTextbox(
-            self._content_frame,
-            fg_color=AppTheme.BG_INPUT,
-            border_color=AppTheme.BORDER_ACCENT,
-            border_width=1,
-            text_color=AppTheme.FG_MAIN,
-            font=(AppTheme.FONT_FAMILY, AppTheme.FONT_SIZE_SM),
-            height=100,
-            wrap="word",
-        )
-        self._content_entry.insert("1.0", self._prompt.content)
-        self._content_entry.pack(fill="x")
-        self._content_entry.focus_set()
-
-        self._content_hint = ctk.CTkLabel(
-            self._content_frame,
-            text="  Ctrl+Enter to save  ·  Esc to cancel",
-            font=(AppTheme.FONT_FAMILY_UI, AppTheme.FONT_SIZE_XS),
-            text_color=AppTheme.FG_MUTED,
-        )
-        self._content_hint.pack(anchor="w")
-
-        self._content_entry.bind("<Control-Return>", lambda _: self._commit_content_edit())
-        self._content_entry.bind("<Escape>", lambda _: self._cancel_content_edit())
-        self._content_entry.bind("<FocusOut>", lambda _: self._commit_content_edit())
+        self._content_editing = True
+        PromptCard._active_content_card = self
+        self._content_lbl.grid_remove()
+
+        box, hint = self._content_editor()
+        self._content_entry = box
+        self._content_hint = hint
+        box.delete("1.0", "end")
+        box.insert("1.0", self._prompt.content)
+        pad = AppTheme.CARD_PAD
+        box.grid(in_=self, row=2, column=0, columnspan=3, sticky="ew", padx=pad)
+        hint.grid(in_=self, row=3, column=0, columnspan=3, sticky="w", padx=pad, pady=(0, pad))
+        box.focus_set()
 
     def _commit_content_edit(self) -> None:
         if not self._content_editing or self._content_entry is None:
             return
         new_content = self._content_entry.get("1.0", "end-1c").strip()
-        self._content_editing = False
-        self._content_entry.destroy()
-        self._content_entry = None
-        if self._content_hint:
-            self._content_hint.destroy()
-            self._content_hint = None
+        self._release_content_editor()
         if new_content and new_content != self._prompt.content and self._on_inline_edit:
             self._on_inline_edit(self._prompt.id, "content", new_content)
-            preview = new_content[:80].replace("\n", " ") + ("…" if len(new_content) > 80 else "")
             if self._content_lbl:
-                self._content_lbl.configure(text=preview)
+                self._shown_content = new_content  # keep update_from's diff in sync
+                self._content_lbl.configure(text=_make_preview(new_content))
         if self._content_lbl:
-            self._content_lbl.pack(fill="x")
+            self._content_lbl.grid()
 
     def _cancel_content_edit(self) -> None:
         if not self._content_editing or self._content_entry is None:
             return
+        self._release_content_editor()
+        if self._content_lbl:
+            self._content_lbl.grid()
+
+    def _release_content_editor(self) -> None:
+        """Park the shared textbox/hint again after an edit ends."""
         self._content_editing = False
-        self._content_entry.destroy()
+        PromptCard._active_content_card = None
+        self._content_entry.grid_forget()
         self._content_entry = None
-        if self._content_hint:
-            self._content_hint.destroy()
-            self._content_hint = None
-        if self._content_lbl:
-            self._content_lbl.pack(fill="x")
+        self._content_hint.grid_forget()
+        self._content_hint = None
+
+    def _content_editor(self):
+        """Return (creating on first use) this list's shared edit widgets.
+
+        Bindings are installed once and dispatch to whichever card is
+        currently _active_content_card.
+        """
+        pair = PromptCard._content_editors.get(self.master)
+        if pair is None:
+            box = ctk.CTkTextbox(
+                self.master,
+                fg_color=AppTheme.BG_INPUT,
+                border_color=AppTheme.BORDER_ACCENT,
+                border_width=1,
+                text_color=AppTheme.FG_MAIN,
+                font=_FONT_MONO_SM,
+                height=100,
+                wrap="word",
+            )
+            box.bind("<Control-Return>", PromptCard._dispatch_content_commit)
+            box.bind("<Escape>", PromptCard._dispatch_content_cancel)
+            box.bind("<FocusOut>", PromptCard._dispatch_content_commit)
+            hint = ctk.CTkLabel(
+                self.master,
+                text="  Ctrl+Enter to save  ·  Esc to cancel",
+                font=_FONT_UI_XS,
+                text_color=AppTheme.FG_MUTED,
+            )
+            pair = (box, hint)
+            PromptCard._content_editors[self.master] = pair
+        return pair
+
+    @staticmethod
+    def _dispatch_content_commit(_event: object = None) -> None:
+        card = PromptCard._active_content_card
+        if card is not None:
+            card._commit_content_edit()
+
+    @staticmethod
+    def _dispatch_content_cancel(_event: object = None) -> None:
+        card = PromptCard._active_content_card
+        if card is not None:
+            card._cancel_content_edit()
+
+    def _toolbar(self) -> _CardToolbar:
+        """Return (creating on first use) the toolbar shared by this list."""
+        toolbar = PromptCard._toolbars.get(self.master)
+        if toolbar is None:
+            toolbar = _CardToolbar(self.master)
+            PromptCard._toolbars[self.master] = toolbar
+        return toolbar
+
+    # ------------------------------------------------------------------
+    # Teardown
+    # ------------------------------------------------------------------
+
+    def destroy(self) -> None:
+        """Drop data/callback references before Tk teardown.
+
+        Tk-side references (bind-tag card_refs, the shared editors'
+        active-card slots, CTk internals) must not keep a destroyed card
+        – and through it a Prompt and the service callbacks – alive for
+        the rest of a long session.
+        """
+        if PromptCard._active_name_card is self:
+            PromptCard._active_name_card = None
+        if PromptCard._active_content_card is self:
+            PromptCard._active_content_card = None
+        for lbl in (self._name_lbl, self._content_lbl):
+            if lbl is not None:
+                for w in (getattr(lbl, "_canvas", None), getattr(lbl, "_label", None)):
+                    if w is not None:
+                        w.card_ref = None
+        self._prompt = None
+        self._on_copy = None
+        self._on_delete = None
+        self._on_edit = None
+        self._on_favourite = None
+        self._on_role_change = None
+        self._on_inline_edit = None
+        self._name_lbl = None
+        self._name_entry = None
+        self._content_lbl = None
+        self._content_entry = None
+        self._content_hint = None
+        super().destroy()
 
     # ------------------------------------------------------------------
     # Standard handlers